@@ -1,5 +1,8 @@
 """Consensus layer genesis state, block, and anchor construction for tests."""
 
+from functools import lru_cache
+from typing import Final
+
 from consensus_testing.keys import XmssKeyManager
 from lean_spec.spec.crypto.merkleization import hash_tree_root
 from lean_spec.spec.forks import Checkpoint, Interval, Slot, ValidatorIndex
@@ -18,15 +21,28 @@ from lean_spec.spec.forks.lstar.containers import (
 from lean_spec.spec.forks.lstar.spec import LstarSpec
 from lean_spec.spec.ssz import Bytes52, Uint64
 
+GENESIS_CACHE_SIZE: Final = 64
+"""
+Number of distinct genesis states and anchors kept for reuse across tests.
+
+States and blocks are frozen, so every caller with equal arguments can share one built value.
+"""
+
 
 def build_genesis_state(
     num_validators: int = 4,
     *,
     genesis_time: Uint64 = Uint64(0),
     keyed: bool = True,
-    fork: LstarSpec = LstarSpec(),
 ) -> State:
     """Build a genesis pre-state for consensus tests, with real or zeroed validator keys."""
+    # Passing every argument positionally gives one cache entry per argument set.
+    return _build_genesis_state(num_validators, genesis_time, keyed)
+
+
+@lru_cache(maxsize=GENESIS_CACHE_SIZE)
+def _build_genesis_state(num_validators: int, genesis_time: Uint64, keyed: bool) -> State:
+    """Genesis pre-state for one argument set, built once and shared."""
     if keyed:
         key_manager = XmssKeyManager.shared()
         if num_validators > len(key_manager):
@@ -34,18 +50,19 @@ def build_genesis_state(
                 f"Not enough keys: need {num_validators} validators "
                 f"but the key manager has only {len(key_manager)} keys"
             )
-        validators = [
-            Validator(
-                attestation_public_key=Bytes52(
-                    key_manager.get_public_keys(ValidatorIndex(validator_index))[0].encode_bytes()
-                ),
-                proposal_public_key=Bytes52(
-                    key_manager.get_public_keys(ValidatorIndex(validator_index))[1].encode_bytes()
-                ),
-                index=ValidatorIndex(validator_index),
+        # Look up each validator's key pair once and read both roles from it.
+        validators = []
+        for validator_index in map(ValidatorIndex, range(num_validators)):
+            attestation_public_key, proposal_public_key = key_manager.get_public_keys(
+                validator_index
+            )
+            validators.append(
+                Validator(
+                    attestation_public_key=Bytes52(attestation_public_key.encode_bytes()),
+                    proposal_public_key=Bytes52(proposal_public_key.encode_bytes()),
+                    index=validator_index,
+                )
             )
-            for validator_index in range(num_validators)
-        ]
     else:
         validators = [
             Validator(
@@ -56,7 +73,7 @@ def build_genesis_state(
             for validator_position in range(num_validators)
         ]
 
-    return fork.generate_genesis(
+    return LstarSpec().generate_genesis(
         genesis_time=genesis_time,
         validators=Validators(data=validators),
     )
@@ -77,13 +94,22 @@ def build_anchor(
     num_validators: int,
     anchor_slot: Slot,
     *,
-    fork: LstarSpec = LstarSpec(),
     genesis_time: Uint64 = Uint64(0),
     keyed: bool = True,
     synced: bool = False,
 ) -> tuple[State, Block]:
     """Build an anchor by advancing the genesis state through a slot, genesis pair at slot 0."""
-    state = build_genesis_state(num_validators, genesis_time=genesis_time, keyed=keyed, fork=fork)
+    # Passing every argument positionally gives one cache entry per argument set.
+    return _build_anchor(num_validators, anchor_slot, genesis_time, keyed, synced)
+
+
+@lru_cache(maxsize=GENESIS_CACHE_SIZE)
+def _build_anchor(
+    num_validators: int, anchor_slot: Slot, genesis_time: Uint64, keyed: bool, synced: bool
+) -> tuple[State, Block]:
+    """Anchor state and block for one argument set, built once and shared."""
+    state = _build_genesis_state(num_validators, genesis_time, keyed)
+    fork = LstarSpec()
 
     current_block = reconstruct_block_from_header(state)
     parent_root = hash_tree_root(current_block)
@@ -110,8 +136,8 @@ def build_anchor(
 
     # Rebase the state as a freshly checkpoint-synced node would see it.
     # Such a node trusts the anchor as finalized, so both checkpoints move there.
-    anchor_root = hash_tree_root(current_block)
-    anchor_checkpoint = Checkpoint(root=anchor_root, slot=anchor_slot)
+    # The advance loop already hashed the anchor block as the last parent root.
+    anchor_checkpoint = Checkpoint(root=parent_root, slot=anchor_slot)
 
     # The justified-slots window starts at the slot after the finalized boundary.
     # Moving that boundary to the anchor drops the leading bits; nothing past it exists.
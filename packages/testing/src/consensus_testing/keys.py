@@ -51,22 +51,27 @@ LEAN_ENV_TO_SCHEMES: dict[str, GeneralizedXmssScheme] = {
 """Short scheme names mapped to their XMSS scheme instances."""
 
 
-def create_dummy_signature() -> Signature:
-    """Create a zero-filled signature that passes structural checks but fails verification."""
-    zero_digest = HashDigestVector(data=[Fp(0)] * TARGET_CONFIG.HASH_LENGTH_FIELD_ELEMENTS)
+_ZERO_DIGEST = HashDigestVector(data=[Fp(0)] * TARGET_CONFIG.HASH_LENGTH_FIELD_ELEMENTS)
+"""All-zero hash digest shared by every slot of the dummy signature."""
 
+_ZERO_SIGNATURE = Signature(
     # The Merkle authentication path needs one sibling per tree level.
     # The tree height equals the log of the key lifetime.
-    siblings = HashDigestList(data=[zero_digest] * TARGET_CONFIG.LOG_LIFETIME)
-
+    path=HashTreeOpening(siblings=HashDigestList(data=[_ZERO_DIGEST] * TARGET_CONFIG.LOG_LIFETIME)),
+    rho=Randomness(data=[Fp(0)] * TARGET_CONFIG.RAND_LENGTH_FIELD_ELEMENTS),
     # Winternitz one-time signatures use one hash chain per dimension.
-    hashes = HashDigestList(data=[zero_digest] * TARGET_CONFIG.DIMENSION)
+    hashes=HashDigestList(data=[_ZERO_DIGEST] * TARGET_CONFIG.DIMENSION),
+)
+"""
+Zero-filled signature template built once at import.
 
-    return Signature(
-        path=HashTreeOpening(siblings=siblings),
-        rho=Randomness(data=[Fp(0)] * TARGET_CONFIG.RAND_LENGTH_FIELD_ELEMENTS),
-        hashes=hashes,
-    )
+Signatures are frozen, so every caller can share this single instance.
+"""
+
+
+def create_dummy_signature() -> Signature:
+    """Create a zero-filled signature that passes structural checks but fails verification."""
+    return _ZERO_SIGNATURE
 
 
 DEFAULT_MAX_SLOT = Slot(10)
@@ -380,20 +385,24 @@ class XmssKeyManager:
             A single-message aggregate proof covering the given validators.
         """
         signatures = precomputed_signatures or {}
+
+        # Every validator signs the same data, so its root is computed once for all of them.
+        message = hash_tree_root(attestation_data)
+        slot = attestation_data.slot
         raw_xmss = [
             (
                 validator_index,
                 self.get_public_keys(validator_index)[0],
                 signatures.get(validator_index)
-                or self.sign_attestation_data(validator_index, attestation_data),
+                or self._sign_with_secret(validator_index, slot, message, "attestation"),
             )
             for validator_index in validator_indices
         ]
         return SingleMessageAggregate.aggregate(
             children=[],
             raw_xmss=raw_xmss,
-            message=hash_tree_root(attestation_data),
-            slot=attestation_data.slot,
+            message=message,
+            slot=slot,
         )
 
     def build_attestation_proofs(
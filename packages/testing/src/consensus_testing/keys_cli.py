@@ -12,16 +12,18 @@ import time
 import urllib.request
 from concurrent.futures import ProcessPoolExecutor
 from functools import partial
+from itertools import batched
 from pathlib import Path
 
 import click
 
 from consensus_testing.keys import (
     LEAN_ENV_TO_SCHEMES,
+    KeyRole,
     compute_key_set_digest,
     get_keys_directory,
 )
-from lean_spec.spec.crypto.xmss.containers import ValidatorKeyPair
+from lean_spec.spec.crypto.xmss.containers import KeyPair, ValidatorKeyPair
 from lean_spec.spec.crypto.xmss.interface import GeneralizedXmssScheme
 from lean_spec.spec.forks import Slot
 from lean_spec.spec.ssz import Uint64
@@ -51,32 +53,22 @@ CLI_DEFAULT_MAX_SLOT = Slot(100)
 """Maximum slot when generating keys via CLI, inclusive."""
 
 
-def _generate_single_keypair(
-    scheme: GeneralizedXmssScheme, num_slots: int, index: int
-) -> ValidatorKeyPair:
+def _generate_single_key(
+    scheme: GeneralizedXmssScheme, num_slots: int, validator_index: int, role: KeyRole
+) -> KeyPair:
     """
-    Generate attestation and proposal key pairs for one validator.
+    Generate one role's key pair for one validator.
 
     Defined at module level so it can be pickled for multiprocessing.
     """
-    # Separate keys let one validator sign both roles in a slot without exhausting a one-time leaf.
     start = time.monotonic()
-    print(f"[key #{index}] generating attestation key...", flush=True)
-    attestation_keypair = scheme.key_gen(Slot(0), Uint64(num_slots))
-
-    elapsed = time.monotonic() - start
-    print(
-        f"[key #{index}] attestation key done ({elapsed:.0f}s), generating proposal key...",
-        flush=True,
-    )
-    proposal_keypair = scheme.key_gen(Slot(0), Uint64(num_slots))
+    print(f"[key #{validator_index}] generating {role} key...", flush=True)
+    key_pair = scheme.key_gen(Slot(0), Uint64(num_slots))
 
     elapsed = time.monotonic() - start
-    print(f"[key #{index}] done ({elapsed:.0f}s)", file=sys.stderr, flush=True)
+    print(f"[key #{validator_index}] {role} key done ({elapsed:.0f}s)", file=sys.stderr, flush=True)
 
-    return ValidatorKeyPair(
-        attestation_keypair=attestation_keypair, proposal_keypair=proposal_keypair
-    )
+    return key_pair
 
 
 def _generate_keys(lean_env: str, count: int, max_slot: int) -> None:
@@ -97,11 +89,30 @@ def _generate_keys(lean_env: str, count: int, max_slot: int) -> None:
     for old_file in keys_directory.glob("*.json"):
         old_file.unlink()
 
-    # Results arrive in index order from the parallel map.
+    # Separate keys let one validator sign both roles in a slot without exhausting a one-time leaf.
+    # Each role is its own request, so both keys of a validator generate on different cores.
+    #
+    #   key_generation_requests: (0, attestation) (0, proposal) (1, attestation) (1, proposal) ...
+    key_generation_requests: list[tuple[int, KeyRole]] = [
+        (validator_index, role)
+        for validator_index in range(count)
+        for role in ("attestation", "proposal")
+    ]
+    requested_validator_indices = [
+        validator_index for validator_index, _ in key_generation_requests
+    ]
+    requested_roles = [role for _, role in key_generation_requests]
+
+    # Results arrive in request order from the parallel map, two per validator.
     gen_start = time.monotonic()
     with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        worker_func = partial(_generate_single_keypair, scheme, num_slots)
-        for validator_index, key_pair in enumerate(executor.map(worker_func, range(count))):
+        worker_func = partial(_generate_single_key, scheme, num_slots)
+        for validator_index, (attestation_keypair, proposal_keypair) in enumerate(
+            batched(executor.map(worker_func, requested_validator_indices, requested_roles), 2)
+        ):
+            key_pair = ValidatorKeyPair(
+                attestation_keypair=attestation_keypair, proposal_keypair=proposal_keypair
+            )
             elapsed = time.monotonic() - gen_start
             print(
                 f"[{validator_index + 1}/{count}] saved key #{validator_index} "
@@ -37,7 +37,7 @@ from lean_spec.spec.forks.lstar.spec import LstarSpec
 from lean_spec.spec.ssz import Bytes32, Uint64
 
 
-@dataclass
+@dataclass(slots=True)
 class MockNetworkRequester:
     """Network double that serves pre-loaded blocks and logs every request."""
 
@@ -93,7 +93,7 @@ class MockNetworkRequester:
         return root
 
 
-@dataclass
+@dataclass(slots=True)
 class MockEventSource:
     """Event source double that yields a predefined list of events."""
 
@@ -120,14 +120,14 @@ class MockEventSource:
         self._published.append((topic, data))
 
 
-@dataclass
+@dataclass(slots=True)
 class _MockBlock:
     """Terminal genesis block stub carrying only the slot used in lookups."""
 
     slot: Slot = field(default_factory=lambda: Slot(0))
 
 
-@dataclass
+@dataclass(slots=True)
 class MockForkchoiceStore:
     """
     In-memory forkchoice store double for sync-service tests.
@@ -235,7 +235,7 @@ class MockForkchoiceStore:
         return self
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecordedCall:
     """One database call captured by the recording database double."""
 
@@ -252,6 +252,8 @@ class RecordedCall:
 class RecordingSyncDatabase:
     """Database double that records the calls a persisting writer makes."""
 
+    __slots__ = ("calls",)
+
     def __init__(self) -> None:
         """Start with an empty call log."""
         self.calls: list[RecordedCall] = []
@@ -111,7 +111,6 @@ class ApiEndpointTest(BaseTestSpec):
         fork = LstarSpec()
         # Walk the chain from genesis using empty blocks; slot 0 returns the genesis pair unchanged.
         state, block = build_anchor(
-            fork=fork,
             num_validators=self.genesis_params.get("numValidators", 4),
             anchor_slot=Slot(self.genesis_params.get("anchorSlot", 0)),
             genesis_time=Uint64(self.genesis_params.get("genesisTime", 0)),
@@ -8,7 +8,6 @@ from consensus_testing.test_fixtures.hex_codec import to_hex
 from lean_spec.base import StrictBaseModel
 from lean_spec.node.sync.checkpoint_sync import verify_checkpoint_state
 from lean_spec.spec.forks import Slot
-from lean_spec.spec.forks.lstar.spec import LstarSpec
 from lean_spec.spec.ssz import Uint64
 
 
@@ -46,10 +45,8 @@ class VerifyCheckpoint(StrictBaseModel):
 
     def run(self) -> VerifyCheckpointOutput:
         """Build the requested state and report the verification verdict."""
-        fork = LstarSpec()
         # Slot 0 makes the anchor builder yield the plain genesis state.
         state, _ = build_anchor(
-            fork=fork,
             num_validators=self.num_validators,
             anchor_slot=Slot(self.anchor_slot),
             genesis_time=Uint64(0),
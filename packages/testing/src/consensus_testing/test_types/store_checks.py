@@ -277,11 +277,9 @@ class StoreChecks(SelectiveCheck):
         if "attestation_target_slot" in fields:
             _check("attestation_target.slot", attestation_target.slot, self.attestation_target_slot)
 
-            block_found = any(
-                block.slot == self.attestation_target_slot and block_root == attestation_target.root
-                for block_root, block in store.blocks.items()
-            )
-            if not block_found:
+            # Blocks are keyed by root, so the target's block is one lookup away.
+            target_block = store.blocks.get(attestation_target.root)
+            if target_block is None or target_block.slot != self.attestation_target_slot:
                 block_roots_at_target_slot = [
                     f"0x{block_root.hex()}"
                     for block_root, block in store.blocks.items()
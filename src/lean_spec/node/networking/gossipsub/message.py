@@ -142,9 +142,15 @@ class GossipsubMessage:
         if domain is None:
             domain = MESSAGE_DOMAIN_INVALID_SNAPPY
 
-        preimage = bytes(domain) + len(topic).to_bytes(8, "little") + topic + data
-
-        return MessageId(hashlib.sha256(preimage).digest()[:20])
+        # Feed the preimage piecewise.
+        #
+        # Concatenating first would copy the whole payload just to hash it.
+        hasher = hashlib.sha256(domain)
+        hasher.update(len(topic).to_bytes(8, "little"))
+        hasher.update(topic)
+        hasher.update(data)
+
+        return MessageId(hasher.digest()[:20])
 
     def __hash__(self) -> int:
         """
@@ -566,12 +566,12 @@ class SyncService:
         for attestation in block_attestations:
             public_keys_per_message.append(
                 [
-                    PublicKey.decode_bytes(validators[validator_index].attestation_public_key)
+                    validators[validator_index].get_attestation_public_key()
                     for validator_index in attestation.aggregation_bits.to_validator_indices()
                 ]
             )
         public_keys_per_message.append(
-            [PublicKey.decode_bytes(validators[block.block.proposer_index].proposal_public_key)]
+            [validators[block.block.proposer_index].get_proposal_public_key()]
         )
 
         # Index local partials by data root.
@@ -595,15 +595,12 @@ class SyncService:
                 continue
 
             data_root = hash_tree_root(attestation_data)
-            block_participants = set(attestation.aggregation_bits.to_validator_indices())
-
             local_proofs = local_proofs_by_root.get(data_root, [])
-            local_union: set = set()
-            for proof in local_proofs:
-                local_union |= set(proof.participants.to_validator_indices())
 
             # Act only when the block adds validators not already held.
-            if not (block_participants - local_union):
+            if attestation.aggregation_bits.is_covered_by(
+                proof.participants for proof in local_proofs
+            ):
                 continue
 
             try:
@@ -622,9 +619,7 @@ class SyncService:
                             (
                                 child,
                                 [
-                                    PublicKey.decode_bytes(
-                                        validators[validator_index].attestation_public_key
-                                    )
+                                    validators[validator_index].get_attestation_public_key()
                                     for validator_index in child.participants.to_validator_indices()
                                 ],
                             )
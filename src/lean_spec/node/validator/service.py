@@ -243,19 +243,22 @@ class ValidatorService:
         if head_state is None:
             return
 
+        # Every local validator votes from the same store snapshot, so they share one vote.
+        attestation_data = self.spec.produce_attestation_data(store, slot)
+        attestation_root = hash_tree_root(attestation_data)
+
         for validator_index in self.registry.indices():
             validator_entry = self.registry.get(validator_index)
             if validator_entry is None:
                 raise ValueError(f"No secret key for validator {validator_index}")
 
-            attestation_data = self.spec.produce_attestation_data(store, slot)
             signed_attestation = SignedAttestation(
                 validator_index=validator_index,
                 data=attestation_data,
                 signature=self._sign_with_key(
                     validator_entry,
                     attestation_data.slot,
-                    hash_tree_root(attestation_data),
+                    attestation_root,
                     "attestation_secret_key",
                 ),
             )
@@ -324,9 +327,7 @@ class ValidatorService:
         validators = key_state.validators
         if not validator_index.is_within_registry(Uint64(len(validators))):
             raise ValueError(f"Validator {validator_index} not found in state validators")
-        proposer_public_key = PublicKey.decode_bytes(
-            validators[validator_index].proposal_public_key
-        )
+        proposer_public_key = validators[validator_index].get_proposal_public_key()
 
         # Wrap the proposer's raw XMSS signature into a singleton single-message aggregate.
         # The single fresh entry carries the proposer index alongside its key and signature.
@@ -351,7 +352,7 @@ class ValidatorService:
                         f"active set has {num_validators} validators"
                     )
                 participant_public_keys.append(
-                    PublicKey.decode_bytes(validators[validator_index].attestation_public_key)
+                    validators[validator_index].get_attestation_public_key()
                 )
             public_keys_per_aggregate.append(participant_public_keys)
 
@@ -6,7 +6,7 @@ import math
 from collections.abc import Sequence
 from functools import singledispatch
 from hashlib import sha256
-from itertools import accumulate, batched, repeat
+from itertools import accumulate, repeat
 from typing import Final
 
 from lean_spec.spec.crypto.koalabear import Fp
@@ -116,24 +116,29 @@ def merkleize(chunks: Sequence[Bytes32], limit: int | None = None) -> Bytes32:
     # Walk one tree layer per outer iteration.
     # A missing right sibling pulls the all-zero subtree of the current size from the cache,
     # so unused zero leaves are never allocated.
-    level: list[Bytes32] = list(chunks)
+    #
+    # Inner nodes stay raw digests; only the root is wrapped as Bytes32.
+    # Wrapping every node would re-validate a width that sha256 already guarantees.
+    #
+    # Each layer is packed into one buffer, so every parent hashes a 64-byte window of it:
+    #
+    #     buffer : | c0 c1 | c2 c3 | c4 ZERO |
+    #     parents:    h01     h23    h(c4, ZERO)
+    level: list[bytes] = list(chunks)
     subtree_size = 1
     while subtree_size < width:
-        next_level: list[Bytes32] = []
-        # Each pair holds the left and right child of one parent node.
-        # An odd tail yields a length-one tuple.
-        # Its missing right sibling is the all-zero subtree of the current size.
-        for child_pair in batched(level, 2):
-            left = child_pair[0]
-            right = child_pair[1] if len(child_pair) == 2 else _zero_tree_root(subtree_size)
-            next_level.append(Bytes32(sha256(left + right).digest()))
-        level = next_level
+        # An odd layer has no right sibling for its last node.
+        # That sibling is the all-zero subtree of the current size.
+        if len(level) % 2:
+            level.append(_zero_tree_root(subtree_size))
+        buffer = b"".join(level)
+        level = [sha256(buffer[start : start + 64]).digest() for start in range(0, len(buffer), 64)]
         subtree_size *= 2
 
     # Invariant: width is the next power of two of the leaf count or capacity,
     # so the loop above halves the level count down to exactly one root.
     assert len(level) == 1
-    return level[0]
+    return Bytes32(level[0])
 
 
 def mix_in_length(root: Bytes32, length: int) -> Bytes32:
@@ -170,9 +175,10 @@ def _pack_bytes(data: bytes) -> list[Bytes32]:
 
     Inner chunks are already chunk-aligned; only the trailing chunk is padded.
     """
+    # Pad the whole payload once, so every slice below is already a full chunk.
+    padded = data + bytes(-len(data) % BYTES_PER_CHUNK)
     return [
-        Bytes32(data[i : i + BYTES_PER_CHUNK].ljust(BYTES_PER_CHUNK, b"\x00"))
-        for i in range(0, len(data), BYTES_PER_CHUNK)
+        Bytes32(padded[i : i + BYTES_PER_CHUNK]) for i in range(0, len(padded), BYTES_PER_CHUNK)
     ]
 
 
@@ -197,6 +203,20 @@ def _pack_bits(bits: Sequence[Boolean]) -> list[Bytes32]:
     return _pack_bytes(packed_bits.to_bytes(math.ceil(len(bits) / 8), "little"))
 
 
+def _composite_leaves(elements: Sequence[object]) -> list[Bytes32]:
+    """
+    Leaf chunks for a collection of non-basic elements.
+
+    A 32-byte value is exactly one chunk, so it is its own hash tree root.
+    Such elements (block hashes, justification roots) are used as-is,
+    skipping one dispatch and one single-leaf merkleize per element.
+    Every other element contributes its own hash tree root.
+    """
+    return [
+        element if isinstance(element, Bytes32) else hash_tree_root(element) for element in elements
+    ]
+
+
 @singledispatch
 def hash_tree_root(value: object) -> Bytes32:
     """
@@ -253,14 +273,14 @@ def _hash_tree_root_vector(value: SSZVector) -> Bytes32:
     element_type, length = cls.ELEMENT_TYPE, cls.LENGTH
     if issubclass(element_type, (BaseUint, Boolean, Fp)):
         # Basic elements pack their serialized bytes into a single byte stream before chunking.
+        #
+        # A basic collection serializes as its elements back to back.
+        # Its own encoding is that stream, including any bulk encoder a subclass provides.
         element_size = element_type.get_byte_length()
         limit_chunks = math.ceil(length * element_size / BYTES_PER_CHUNK)
-        return merkleize(
-            _pack_bytes(b"".join(e.encode_bytes() for e in value)),
-            limit=limit_chunks,
-        )
+        return merkleize(_pack_bytes(value.encode_bytes()), limit=limit_chunks)
     # Composite elements each contribute their own hash tree root as a leaf.
-    return merkleize([hash_tree_root(e) for e in value], limit=length)
+    return merkleize(_composite_leaves(value.data), limit=length)
 
 
 @hash_tree_root.register
@@ -270,12 +290,9 @@ def _hash_tree_root_list(value: SSZList) -> Bytes32:
     if issubclass(element_type, (BaseUint, Boolean, Fp)):
         element_size = element_type.get_byte_length()
         limit_chunks = math.ceil(limit * element_size / BYTES_PER_CHUNK)
-        root = merkleize(
-            _pack_bytes(b"".join(e.encode_bytes() for e in value)),
-            limit=limit_chunks,
-        )
+        root = merkleize(_pack_bytes(value.encode_bytes()), limit=limit_chunks)
     else:
-        root = merkleize([hash_tree_root(e) for e in value], limit=limit)
+        root = merkleize(_composite_leaves(value.data), limit=limit)
     return mix_in_length(root, len(value))
 
 
@@ -1445,7 +1445,8 @@ class Poseidon:
         if len(current_state) != self._width:
             raise ValueError(f"Input state must have length {self._width}")
 
-        state = np.array([int(fp) for fp in current_state], dtype=np.int64)
+        # Field elements are plain ints underneath, so numpy reads them in one pass.
+        state = np.fromiter(current_state, dtype=np.int64, count=self._width)
 
         _permute_jit(
             state,
@@ -1457,7 +1458,8 @@ class Poseidon:
             P,
         )
 
-        return [Fp(value=int(state_element)) for state_element in state]
+        # Convert back through native ints: indexing the array would box a numpy scalar per element.
+        return [Fp(state_element) for state_element in state.tolist()]
 
 
 _MDS_FIRST_ROW_16: list[int] = [1, 1, 51, 1, 11, 17, 2, 1, 101, 63, 15, 2, 67, 22, 13, 3]
@@ -115,28 +115,27 @@ def message_hash(
     poseidon: PoseidonXmss,
     config: XmssConfig,
     parameter: Parameter,
-    epoch: Uint64,
+    epoch_field_elements: list[Fp],
     rho: Randomness,
-    message: Bytes32,
+    message_field_elements: list[Fp],
 ) -> list[int] | None:
     """
     Hash the inputs with Poseidon and decode into a candidate codeword.
 
+    The caller encodes the epoch and message once, with encode_epoch and encode_message.
+    Signing retries with fresh randomness, and only rho changes between attempts.
+
     Args:
         poseidon: Cached Poseidon engine.
         config: Active XMSS configuration.
         parameter: Public parameter P.
-        epoch: Current epoch.
+        epoch_field_elements: Current epoch, encoded as field elements.
         rho: Per-attempt randomness.
-        message: Message being signed.
+        message_field_elements: Message being signed, encoded as field elements.
 
     Returns:
         Codeword of DIMENSION digits in [0, BASE-1], or None on rejection.
     """
-    # Encode the message and epoch as field elements before hashing.
-    message_field_elements = encode_message(config, message)
-    epoch_field_elements = encode_epoch(config, epoch)
-
     # One Poseidon call produces enough output for the aborting decode.
     base_input = message_field_elements + parameter.elements + epoch_field_elements + rho.elements
     poseidon_output = poseidon.compress(base_input, 24, config.MH_HASH_LENGTH_FIELD_ELEMENTS)
@@ -148,9 +147,9 @@ def target_sum_encode(
     poseidon: PoseidonXmss,
     config: XmssConfig,
     parameter: Parameter,
-    epoch: Uint64,
+    epoch_field_elements: list[Fp],
     rho: Randomness,
-    message: Bytes32,
+    message_field_elements: list[Fp],
 ) -> list[int] | None:
     """
     Encode a message into a codeword if it meets the target sum.
@@ -161,15 +160,17 @@ def target_sum_encode(
         poseidon: Cached Poseidon engine.
         config: Active XMSS configuration.
         parameter: Public parameter for domain separation.
-        epoch: Current epoch.
+        epoch_field_elements: Current epoch, encoded as field elements.
         rho: Per-attempt randomness.
-        message: Message being signed.
+        message_field_elements: Message being signed, encoded as field elements.
 
     Returns:
         Codeword on success, None when the attempt must be retried.
     """
     # Phase 1: aborting hypercube decode of the Poseidon output.
-    codeword_candidate = message_hash(poseidon, config, parameter, epoch, rho, message)
+    codeword_candidate = message_hash(
+        poseidon, config, parameter, epoch_field_elements, rho, message_field_elements
+    )
     if codeword_candidate is None:
         return None
 
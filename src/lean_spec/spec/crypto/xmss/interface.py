@@ -4,7 +4,7 @@ from lean_spec.base import StrictBaseModel
 from lean_spec.config import LEAN_ENV
 from lean_spec.spec.crypto.xmss.constants import PROD_CONFIG, TEST_CONFIG, XmssConfig
 from lean_spec.spec.crypto.xmss.containers import KeyPair, PublicKey, SecretKey, Signature
-from lean_spec.spec.crypto.xmss.encoding import target_sum_encode
+from lean_spec.spec.crypto.xmss.encoding import encode_epoch, encode_message, target_sum_encode
 from lean_spec.spec.crypto.xmss.field import random_parameter
 from lean_spec.spec.crypto.xmss.merkle import HashSubTree, combined_path, verify_path
 from lean_spec.spec.crypto.xmss.poseidon import POSEIDON, PoseidonXmss
@@ -229,10 +229,20 @@ class GeneralizedXmssScheme(StrictBaseModel):
         #
         # The randomness is derived from the PRF, keyed by the message and an attempt counter.
         # Signing the same message twice is therefore reproducible.
+        #
+        # Only the randomness changes between attempts.
+        # The slot and message are encoded as field elements once, before the search.
+        epoch_field_elements = encode_epoch(config, slot)
+        message_field_elements = encode_message(config, message)
         for attempts in range(config.MAX_TRIES):
             rho = secret_key.prf_key.derive_randomness(config, slot, message, Uint64(attempts))
             codeword = target_sum_encode(
-                self.poseidon, config, secret_key.parameter, slot, rho, message
+                self.poseidon,
+                config,
+                secret_key.parameter,
+                epoch_field_elements,
+                rho,
+                message_field_elements,
             )
             if codeword is not None:
                 break
@@ -313,7 +323,12 @@ class GeneralizedXmssScheme(StrictBaseModel):
         # Phase 2: rederive the codeword from the signature's randomness.
         # A failing aborting decode means the signature cannot be valid.
         codeword = target_sum_encode(
-            self.poseidon, config, public_key.parameter, slot, signature.rho, message
+            self.poseidon,
+            config,
+            public_key.parameter,
+            encode_epoch(config, slot),
+            signature.rho,
+            encode_message(config, message),
         )
         if codeword is None:
             return False
@@ -1,12 +1,15 @@
 """Base types for the XMSS signature scheme."""
 
-from typing import Final, NamedTuple
+from typing import IO, Final, NamedTuple, Self, override
 
-from lean_spec.spec.crypto.koalabear import Fp
+import numpy as np
+
+from lean_spec.spec.crypto.koalabear import P_BYTES, Fp, P
 from lean_spec.spec.crypto.xmss.constants import TARGET_CONFIG
 from lean_spec.spec.ssz import Uint64
 from lean_spec.spec.ssz.collections import SSZList, SSZVector
 from lean_spec.spec.ssz.container import Container
+from lean_spec.spec.ssz.exceptions import SSZSerializationError, SSZValueError
 
 
 class TreeTweak(NamedTuple):
@@ -45,7 +48,54 @@ Maximum number of nodes a sparse Merkle tree layer can hold.
 """
 
 
-class HashDigestVector(SSZVector[Fp]):
+class FieldElementVector(SSZVector[Fp]):
+    """
+    Fixed-length vector of field elements converted to and from the wire in bulk.
+
+    Each element is a 4-byte little-endian word below the modulus.
+    The whole vector is therefore one little-endian uint32 array.
+    A single array conversion replaces an encode or decode call per element.
+
+    Subclasses declare LENGTH.
+    """
+
+    @override
+    def serialize(self, stream: IO[bytes]) -> int:
+        """Write the packed little-endian words and return the byte count."""
+        return stream.write(np.fromiter(self.data, dtype="<u4", count=len(self.data)).tobytes())
+
+    @classmethod
+    @override
+    def deserialize(cls, stream: IO[bytes], scope: int) -> Self:
+        """
+        Read LENGTH packed words from a binary stream.
+
+        Raises:
+            SSZSerializationError: When the scope is not LENGTH words or the stream runs short.
+            SSZValueError: When a word is not below the field modulus.
+        """
+        expected_total = P_BYTES * cls.LENGTH
+        if scope != expected_total:
+            raise SSZSerializationError(
+                f"{cls.__name__}: expected {expected_total} bytes, got {scope}"
+            )
+        serialized_bytes = stream.read(scope)
+
+        # Check the complete words first, then the truncated tail.
+        # Errors then match what decoding one element at a time would raise first.
+        complete_length = len(serialized_bytes) - len(serialized_bytes) % P_BYTES
+        words = np.frombuffer(serialized_bytes[:complete_length], dtype="<u4")
+        out_of_range = words[words >= P]
+        if out_of_range.size:
+            raise SSZValueError(f"Value {int(out_of_range[0])} exceeds field modulus {P}")
+        if complete_length != scope:
+            raise SSZSerializationError(
+                f"Expected {P_BYTES} bytes for Fp, got {len(serialized_bytes) - complete_length}"
+            )
+        return cls(data=[Fp(word) for word in words.tolist()])
+
+
+class HashDigestVector(FieldElementVector):
     """
     A single hash digest as a fixed-size vector of field elements.
 
@@ -62,7 +112,7 @@ class HashDigestList(SSZList[HashDigestVector]):
     LIMIT = NODE_LIST_LIMIT
 
 
-class Parameter(SSZVector[Fp]):
+class Parameter(FieldElementVector):
     """
     The public parameter P.
 
@@ -74,7 +124,7 @@ class Parameter(SSZVector[Fp]):
     LENGTH = TARGET_CONFIG.PARAMETER_LENGTH
 
 
-class Randomness(SSZVector[Fp]):
+class Randomness(FieldElementVector):
     """
     Fresh randomness mixed into the message hash during signing.
 
@@ -1,9 +1,9 @@
 """Lstar fork — attestation aggregation."""
 
 from lean_spec.spec.crypto.merkleization import hash_tree_root
-from lean_spec.spec.crypto.xmss.containers import PublicKey
 from lean_spec.spec.forks.lstar._base import LstarSpecBase, LstarStore
 from lean_spec.spec.forks.lstar.containers import (
+    AggregationBits,
     SignedAggregatedAttestation,
     SingleMessageAggregate,
     ValidatorIndex,
@@ -26,62 +26,73 @@ def select_proofs_for_coverage(
     Returns:
         The chosen proofs and the union of validator indices they cover.
     """
-    # Picks accumulate across both pools, sharing one running coverage set.
+    # Picks accumulate across both pools, sharing one running coverage.
+    #
+    # Coverage is a packed bitmask, bit i set once validator i is covered.
+    # It is unpacked into the index set callers consume only once, at the end.
     selected_proofs: list[SingleMessageAggregate] = []
-    covered_validators: set[ValidatorIndex] = set()
+    covered_bitmask = 0
 
     # Priority pool first, so its proofs win before the fallback is touched.
     for proof_pool in (priority_pool, fallback_pool):
         if not proof_pool:
             continue
 
-        # Materialize each proof's validator set once, up front.
-        # Otherwise every comparison below would reparse the bitfield.
-        validators_covered_by = {
-            proof: set(proof.participants.to_validator_indices()) for proof in proof_pool
-        }
+        # Pack each proof's validators into a bitmask and encode it once, up front.
+        # Otherwise every comparison below would reparse the bitfield and re-serialize the proof.
+        bitmask_of = {proof: proof.participants.to_bitmask() for proof in proof_pool}
+        encoding_of = {proof: proof.encode_bytes() for proof in proof_pool}
+
+        # Everything this pool could ever cover.
+        # Once the running coverage reaches it, no remaining proof can add anything.
+        pool_bitmask = covered_bitmask
+        for proof_bitmask in bitmask_of.values():
+            pool_bitmask |= proof_bitmask
 
         # Greedy set-cover: repeatedly take the proof adding the most new validators.
         candidate_proofs = set(proof_pool)
-        while candidate_proofs:
+        while candidate_proofs and pool_bitmask & ~covered_bitmask:
             # Pick the proof adding the most still-uncovered validators.
             #
             # The key is a tuple, compared left to right:
             #
-            #   - len(new coverage)  most new validators wins.
-            #   - encoded bytes      ties go to the largest canonical encoding.
+            #   - popcount of new coverage  most new validators wins.
+            #   - encoded bytes             ties go to the largest canonical encoding.
             #
             # Without the second key, ties fall to set iteration order.
             # That order is randomized per process, so different runs could pick differently.
             # The encoding makes every tie resolve to one stable winner.
             #
-            # Example, with covered_validators = {0, 1} and two candidates left:
+            # Example, with validators {0, 1} covered and two candidates left:
             #
-            #   A covers {1, 2, 3}  ->  newly_covered = {2, 3}  ->  key = (2, bytes_A)
-            #   B covers {2}        ->  newly_covered = {2}     ->  key = (1, bytes_B)
+            #   covered_bitmask = 0b0011
+            #
+            #   A covers {1, 2, 3}  ->  0b1110 & ~0b0011 = 0b1100  ->  key = (2, bytes_A)
+            #   B covers {2}        ->  0b0100 & ~0b0011 = 0b0100  ->  key = (1, bytes_B)
             #
             #   max picks A, since 2 > 1.
             best_proof = max(
                 candidate_proofs,
                 key=lambda proof: (
-                    len(validators_covered_by[proof] - covered_validators),
-                    proof.encode_bytes(),
+                    (bitmask_of[proof] & ~covered_bitmask).bit_count(),
+                    encoding_of[proof],
                 ),
             )
 
             # Best adds the most, so if it adds nothing, nothing does: stop at full coverage.
             # Greedy only affects how many proofs, never which validators end up covered.
-            newly_covered = validators_covered_by[best_proof] - covered_validators
-            if not newly_covered:
+            newly_covered_bitmask = bitmask_of[best_proof] & ~covered_bitmask
+            if not newly_covered_bitmask:
                 break
 
             # Record this proof as chosen.
             selected_proofs.append(best_proof)
             # Grow the running coverage so later picks are scored against it.
-            covered_validators |= newly_covered
+            covered_bitmask |= newly_covered_bitmask
             # Drop it from contention so it is not weighed again.
             candidate_proofs.discard(best_proof)
 
+    covered_validators = set(AggregationBits.validator_indices_in_bitmask(covered_bitmask))
     return selected_proofs, covered_validators
 
 
@@ -141,26 +152,29 @@ class AggregationMixin(LstarSpecBase):
             #   v = 3  ->  (3, key_3, signature_3)
             #
             #   raw_signatures = [(1, key_1, signature_1), (3, key_3, signature_3)]
+            uncovered_entries = [
+                signature_entry
+                for signature_entry in store.attestation_signatures.get(attestation_data, set())
+                if signature_entry.validator_index not in covered_validators
+            ]
+
+            # Aggregation needs fresh material: one raw signature, or two child proofs to merge.
+            # A lone child proof is already valid, so there is nothing to do.
+            # Decide before sorting or decoding any key, so a skipped data costs nothing more.
+            if not uncovered_entries and len(child_proofs) < 2:
+                continue
+
             raw_signatures = [
                 (
                     signature_entry.validator_index,
-                    PublicKey.decode_bytes(
-                        validators[signature_entry.validator_index].attestation_public_key
-                    ),
+                    validators[signature_entry.validator_index].get_attestation_public_key(),
                     signature_entry.signature,
                 )
                 for signature_entry in sorted(
-                    store.attestation_signatures.get(attestation_data, set()),
-                    key=lambda entry: entry.validator_index,
+                    uncovered_entries, key=lambda entry: entry.validator_index
                 )
-                if signature_entry.validator_index not in covered_validators
             ]
 
-            # Aggregation needs fresh material: one raw signature, or two child proofs to merge.
-            # A lone child proof is already valid, so there is nothing to do.
-            if not raw_signatures and len(child_proofs) < 2:
-                continue
-
             # Phase 3: Aggregate.
             #
             # Each child proof is re-verified while the outer proof is built.
@@ -176,7 +190,7 @@ class AggregationMixin(LstarSpecBase):
                 (
                     child_proof,
                     [
-                        PublicKey.decode_bytes(validators[validator_index].attestation_public_key)
+                        validators[validator_index].get_attestation_public_key()
                         for validator_index in child_proof.participants.to_validator_indices()
                     ],
                 )
@@ -4,7 +4,6 @@ from collections import defaultdict
 from collections.abc import Set as AbstractSet
 
 from lean_spec.spec.crypto.merkleization import hash_tree_root
-from lean_spec.spec.crypto.xmss.containers import PublicKey
 from lean_spec.spec.forks.lstar._base import LstarSpecBase
 from lean_spec.spec.forks.lstar.aggregation import select_proofs_for_coverage
 from lean_spec.spec.forks.lstar.config import (
@@ -209,7 +208,7 @@ class BlockProductionMixin(LstarSpecBase):
                     slot=slot,
                     proposer_index=proposer_index,
                     parent_root=parent_root,
-                    state_root=Bytes32.zero(),
+                    state_root=ZERO_HASH,
                     body=self.block_body_class(
                         attestations=self.aggregated_attestations_class(
                             data=aggregated_attestations
@@ -265,9 +264,7 @@ class BlockProductionMixin(LstarSpecBase):
                         (
                             proof,
                             [
-                                PublicKey.decode_bytes(
-                                    state.validators[validator_index].attestation_public_key
-                                )
+                                state.validators[validator_index].get_attestation_public_key()
                                 for validator_index in proof.participants.to_validator_indices()
                             ],
                         )
@@ -293,7 +290,7 @@ class BlockProductionMixin(LstarSpecBase):
             slot=slot,
             proposer_index=proposer_index,
             parent_root=parent_root,
-            state_root=Bytes32.zero(),
+            state_root=ZERO_HASH,
             body=self.block_body_class(
                 attestations=self.aggregated_attestations_class(data=merged_attestations),
             ),
@@ -6,7 +6,10 @@ An attestation's content is three checkpoints: source, target, and head.
 """
 
 from collections.abc import Sequence
+from functools import lru_cache
+from typing import Final
 
+from lean_spec.spec.crypto.merkleization import hash_tree_root
 from lean_spec.spec.forks.lstar.slot import Slot
 from lean_spec.spec.ssz import ZERO_HASH, Bytes32, Container
 
@@ -85,3 +88,16 @@ class AttestationData(Container):
             and self.target.root == historical_block_hashes[target_slot]
             and self.head.root == historical_block_hashes[head_slot]
         )
+
+
+ATTESTATION_DATA_ROOT_CACHE_SIZE: Final = 4096
+"""Number of distinct attestation data whose roots are remembered."""
+
+
+@hash_tree_root.register(AttestationData)
+@lru_cache(maxsize=ATTESTATION_DATA_ROOT_CACHE_SIZE)
+def _hash_tree_root_attestation_data(value: AttestationData) -> Bytes32:
+    # The same vote is hashed again and again: on gossip, in aggregation, and in blocks.
+    # Attestation data is frozen, and equal data always has an equal root.
+    # So the root is computed once per distinct vote and then reused.
+    return hash_tree_root.dispatch(Container)(value)
@@ -15,10 +15,13 @@ class AggregationBits(BaseBitlist):
     LIMIT = int(VALIDATOR_REGISTRY_LIMIT)
 
     @classmethod
-    def from_indices(cls, indices: Iterable[ValidatorIndex]) -> "AggregationBits":
+    def from_indices(cls, indices: Iterable[int]) -> "AggregationBits":
         """
         Build aggregation bits from validator indices.
 
+        Plain integers are accepted alongside typed indices.
+        Callers need not wrap each index before building the bitfield.
+
         Returns:
             Aggregation bits with exactly the given indices set to True.
 
@@ -69,3 +72,57 @@ class AggregationBits(BaseBitlist):
             )
 
         return ValidatorIndices(data=indices)
+
+    def to_bitmask(self) -> int:
+        """
+        Pack these bits into one integer, with validator i at bit i.
+
+        Set algebra on the packed integer runs in C.
+        No per-validator index objects are materialized.
+
+        Returns:
+            The packed integer; zero when no bits are set.
+        """
+        # The SSZ encoding is already the packed bits plus one delimiter above them.
+        # Clearing the delimiter leaves exactly the participation bits.
+        return int.from_bytes(self.encode_bytes(), "little") ^ (1 << len(self.data))
+
+    @staticmethod
+    def validator_indices_in_bitmask(bitmask: int) -> list[ValidatorIndex]:
+        """
+        Unpack a packed integer back into the validator indices it names.
+
+        The inverse of the packing done by to_bitmask.
+
+        Returns:
+            The indices of the set bits, in ascending order; empty when no bits are set.
+        """
+        # Read the binary digits lowest bit first.
+        #
+        #   0b1011  ->  "1101"  ->  [0, 1, 3]
+        return [
+            ValidatorIndex(index)
+            for index, digit in enumerate(reversed(bin(bitmask)[2:]))
+            if digit == "1"
+        ]
+
+    def is_covered_by(self, others: Iterable["AggregationBits"]) -> bool:
+        """
+        Check whether every validator set here is also set in at least one of the others.
+
+        Example, with self naming {1, 3} and the others naming {0, 1} and {3}:
+
+            self          ->  0b1010
+            union         ->  0b1011
+            self & ~union ->  0b0000   ->  covered
+
+        Args:
+            others: Bitfields whose union is checked against these bits.
+
+        Returns:
+            True when no validator here is missing from the union of the others.
+        """
+        union_bitmask = 0
+        for other in others:
+            union_bitmask |= other.to_bitmask()
+        return self.to_bitmask() & ~union_bitmask == 0
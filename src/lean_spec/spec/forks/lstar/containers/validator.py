@@ -1,9 +1,11 @@
 """The validator registry tracked in the consensus state."""
 
-from typing import Self
+from functools import lru_cache
+from typing import Final, Self
 
 from pydantic import model_validator
 
+from lean_spec.spec.crypto.xmss.containers import PublicKey
 from lean_spec.spec.forks.lstar.config import VALIDATOR_REGISTRY_LIMIT
 from lean_spec.spec.forks.lstar.containers.identifiers import ValidatorIndex
 from lean_spec.spec.ssz import Bytes52, Container, SSZList
@@ -22,6 +24,27 @@ class Validator(Container):
     index: ValidatorIndex = ValidatorIndex(0)
     """Validator index in the registry."""
 
+    def get_attestation_public_key(self) -> PublicKey:
+        """Decoded XMSS key this validator signs attestations with."""
+        return _decode_registry_public_key(self.attestation_public_key)
+
+    def get_proposal_public_key(self) -> PublicKey:
+        """Decoded XMSS key this validator signs block roots with."""
+        return _decode_registry_public_key(self.proposal_public_key)
+
+
+REGISTRY_PUBLIC_KEY_CACHE_SIZE: Final = 4096
+"""Number of distinct registry keys whose decoded form is remembered."""
+
+
+@lru_cache(maxsize=REGISTRY_PUBLIC_KEY_CACHE_SIZE)
+def _decode_registry_public_key(encoded_public_key: Bytes52) -> PublicKey:
+    """Decoded XMSS public key for registry key bytes, memoized by encoding."""
+    # Every signature check and aggregation scans the registry and needs decoded keys.
+    # Registry keys rarely change, so each distinct encoding is decoded once.
+    # Malformed keys raise on every call; lru_cache never stores a failure.
+    return PublicKey.decode_bytes(encoded_public_key)
+
 
 class Validators(SSZList[Validator]):
     """Validator registry tracked in the state."""
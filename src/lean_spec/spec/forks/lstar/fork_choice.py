@@ -1,10 +1,9 @@
 """Lstar fork — fork choice: store, LMD-GHOST, attestation handling."""
 
 import math
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from lean_spec.spec.crypto.merkleization import hash_tree_root
-from lean_spec.spec.crypto.xmss.containers import PublicKey
 from lean_spec.spec.crypto.xmss.interface import TARGET_SIGNATURE_SCHEME
 from lean_spec.spec.forks.lstar._base import LstarSpecBase, LstarStore
 from lean_spec.spec.forks.lstar.config import (
@@ -12,6 +11,7 @@ from lean_spec.spec.forks.lstar.config import (
     INTERVALS_PER_SLOT,
 )
 from lean_spec.spec.forks.lstar.containers import (
+    AggregationBits,
     AggregationError,
     AttestationData,
     AttestationSignatureEntry,
@@ -374,9 +374,7 @@ class ForkChoiceMixin(LstarSpecBase):
                     f"Validator {validator_index} not found in state "
                     f"{attestation_data.target.root.hex()}",
                 )
-            public_key = PublicKey.decode_bytes(
-                target_post_state.validators[validator_index].attestation_public_key
-            )
+            public_key = target_post_state.validators[validator_index].get_attestation_public_key()
 
             # Verify the signature.
             #
@@ -489,7 +487,7 @@ class ForkChoiceMixin(LstarSpecBase):
 
         # Collect the participants' keys, in the order the proof expects them.
         public_keys = [
-            PublicKey.decode_bytes(validators[validator_index].attestation_public_key)
+            validators[validator_index].get_attestation_public_key()
             for validator_index in validator_indices
         ]
 
@@ -667,14 +665,21 @@ class ForkChoiceMixin(LstarSpecBase):
                 continue
 
             # Every proof here shares one attestation data, so they share one slot.
-            # The strict slot comparison below never overwrites between them.
-            # Set iteration order is therefore non-consensus and safe to leave native.
+            # A validator named by several of them casts the same vote each time.
+            # So merge their participants first and visit each validator once.
+            #
+            #   proofs  ->  {0, 1} and {1, 3}  ->  union {0, 1, 3}
+            participants_bitmask = 0
             for proof in proofs:
-                for validator_index in proof.participants.to_validator_indices():
-                    # Keep this vote only when it is newer than the one already stored.
-                    previous_vote = latest_vote_by_validator.get(validator_index)
-                    if previous_vote is None or previous_vote.slot < attestation_data.slot:
-                        latest_vote_by_validator[validator_index] = attestation_data
+                participants_bitmask |= proof.participants.to_bitmask()
+
+            for validator_index in AggregationBits.validator_indices_in_bitmask(
+                participants_bitmask
+            ):
+                # Keep this vote only when it is newer than the one already stored.
+                previous_vote = latest_vote_by_validator.get(validator_index)
+                if previous_vote is None or previous_vote.slot < attestation_data.slot:
+                    latest_vote_by_validator[validator_index] = attestation_data
 
         return latest_vote_by_validator
 
@@ -700,9 +705,17 @@ class ForkChoiceMixin(LstarSpecBase):
         """
         weights: dict[Bytes32, int] = defaultdict(int)
 
-        for attestation_data in attestations.values():
-            # Climb from this vote's head toward genesis, crediting each block.
-            current_root = attestation_data.head.root
+        # Most validators vote for one of a handful of heads.
+        # Count the votes per head first, so each distinct head climbs the chain once.
+        #
+        #   votes   ->  A A B A B  ->  {A: 3, B: 2}  ->  two climbs, not five
+        votes_by_head = Counter(
+            attestation_data.head.root for attestation_data in attestations.values()
+        )
+
+        for head_root, vote_count in votes_by_head.items():
+            # Climb from this head toward genesis, crediting each block with its votes.
+            current_root = head_root
             while current_root in store.blocks:
                 current_block = store.blocks[current_root]
 
@@ -710,7 +723,7 @@ class ForkChoiceMixin(LstarSpecBase):
                 if current_block.slot <= start_slot:
                     break
 
-                weights[current_root] += 1
+                weights[current_root] += vote_count
                 current_root = current_block.parent_root
 
         return weights
@@ -781,6 +794,12 @@ class ForkChoiceMixin(LstarSpecBase):
         children_map: dict[Bytes32, list[Bytes32]] = defaultdict(list)
 
         for root, block in store.blocks.items():
+            # Slots strictly increase from parent to child.
+            # A block at or below the anchor slot can never be reached from the anchor.
+            # Skipping it keeps the map proportional to the live tree, not the whole history.
+            if block.slot <= start_slot:
+                continue
+
             # Prune low-weight branches early when a threshold is set.
             if min_score is not None and weights[root] < min_score:
                 continue
@@ -794,6 +813,13 @@ class ForkChoiceMixin(LstarSpecBase):
 
         # Descend the tree, choosing the heaviest branch at every fork.
         while children := children_map.get(head):
+            # A lone child wins by default; there is nothing to compare it against.
+            #
+            # Linear stretches of the chain are the common case, so this skips most comparisons.
+            if len(children) == 1:
+                head = children[0]
+                continue
+
             # Choose best child: most attestations, then lexicographically highest hash
             head = max(children, key=lambda child_root: (weights[child_root], child_root))
 
@@ -78,7 +78,7 @@ class SignatureMixin(LstarSpecBase):
             # Resolve each voter to the attestation key it signs with.
             public_keys_per_message.append(
                 [
-                    PublicKey.decode_bytes(validators[voter_index].attestation_public_key)
+                    validators[voter_index].get_attestation_public_key()
                     for voter_index in voter_indices
                 ]
             )
@@ -104,9 +104,7 @@ class SignatureMixin(LstarSpecBase):
             )
 
         # Resolve the proposal key, the lone signer of this component.
-        public_keys_per_message.append(
-            [PublicKey.decode_bytes(validators[block.proposer_index].proposal_public_key)]
-        )
+        public_keys_per_message.append([validators[block.proposer_index].get_proposal_public_key()])
 
         # Bind it to the block root and the block's own slot.
         message_bindings.append((hash_tree_root(block), block.slot))
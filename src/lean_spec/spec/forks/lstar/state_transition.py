@@ -38,8 +38,8 @@ class StateTransitionMixin(LstarSpecBase):
         genesis_header = self.block_header_class(
             slot=Slot(0),
             proposer_index=ValidatorIndex(0),
-            parent_root=Bytes32.zero(),
-            state_root=Bytes32.zero(),
+            parent_root=ZERO_HASH,
+            state_root=ZERO_HASH,
             body_root=hash_tree_root(
                 self.block_body_class(attestations=self.aggregated_attestations_class(data=[]))
             ),
@@ -49,8 +49,8 @@ class StateTransitionMixin(LstarSpecBase):
             config=genesis_config,
             slot=Slot(0),
             latest_block_header=genesis_header,
-            latest_justified=Checkpoint(root=Bytes32.zero(), slot=Slot(0)),
-            latest_finalized=Checkpoint(root=Bytes32.zero(), slot=Slot(0)),
+            latest_justified=Checkpoint(root=ZERO_HASH, slot=Slot(0)),
+            latest_finalized=Checkpoint(root=ZERO_HASH, slot=Slot(0)),
             historical_block_hashes=HistoricalBlockHashes(data=[]),
             justified_slots=JustifiedSlots(data=[]),
             validators=validators,
@@ -79,7 +79,7 @@ class StateTransitionMixin(LstarSpecBase):
             # Invariant: the header's state root is empty only on the first empty slot
             # after a block, so this fills it at most once per block.
             # Later empty slots reuse the populated root.
-            needs_state_root = state.latest_block_header.state_root == Bytes32.zero()
+            needs_state_root = state.latest_block_header.state_root == ZERO_HASH
             cached_state_root = (
                 hash_tree_root(state) if needs_state_root else state.latest_block_header.state_root
             )
@@ -163,7 +163,7 @@ class StateTransitionMixin(LstarSpecBase):
             proposer_index=block.proposer_index,
             parent_root=block.parent_root,
             body_root=hash_tree_root(block.body),
-            state_root=Bytes32.zero(),
+            state_root=ZERO_HASH,
         )
 
         return state.model_copy(
@@ -15,7 +15,7 @@ from lean_spec.spec.forks.lstar.containers import (
     ValidatorIndex,
 )
 from lean_spec.spec.forks.lstar.errors import RejectionReason, SpecRejectionError
-from lean_spec.spec.ssz import Bytes32, Uint64
+from lean_spec.spec.ssz import ZERO_HASH, Uint64
 
 
 class ValidatorDutiesMixin(LstarSpecBase):
@@ -89,7 +89,7 @@ class ValidatorDutiesMixin(LstarSpecBase):
         justified_source = store.states[store.head].latest_justified
 
         # Replace the placeholder genesis root with the real one.
-        if justified_source.root == Bytes32.zero():
+        if justified_source.root == ZERO_HASH:
             justified_source = Checkpoint(root=store.head, slot=justified_source.slot)
 
         # Sanity check: the source must be older or equal to the target.
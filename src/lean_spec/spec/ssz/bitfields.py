@@ -18,6 +18,7 @@ from typing import (
     IO,
     Any,
     ClassVar,
+    Final,
     Self,
     overload,
     override,
@@ -29,6 +30,33 @@ from lean_spec.spec.ssz.boolean import Boolean
 from lean_spec.spec.ssz.exceptions import SSZSerializationError, SSZTypeError, SSZValueError
 from lean_spec.spec.ssz.ssz_base import SSZModel
 
+_BOOLEAN_BY_BIT: Final = (Boolean(False), Boolean(True))
+"""The two Boolean values, indexed by bit: false at 0, true at 1."""
+
+
+def _coerce_bits(bits: Sequence[Any]) -> tuple[Boolean, ...]:
+    """
+    Wrap each value in Boolean.
+
+    Bools and Booleans map straight onto the two shared instances.
+    Anything else goes through the constructor, which rejects values outside 0 or 1.
+    """
+    # Bitfields reach thousands of bits; one constructor call per bit dominated validation.
+    return tuple(
+        _BOOLEAN_BY_BIT[bit] if type(bit) is bool or type(bit) is Boolean else Boolean(bit)
+        for bit in bits
+    )
+
+
+def _hash_bits(bitfield_type: type, bits: Sequence[Boolean]) -> int:
+    """
+    Hash a bitfield as its type plus one byte per bit.
+
+    The default model hash calls each Boolean's Python-level hash in turn.
+    Packing the bits into bytes first runs in C, which matters for registry-wide bitfields.
+    """
+    return hash((bitfield_type, bytes(bits)))
+
 
 class BaseBitvector(SSZModel):
     """
@@ -76,8 +104,12 @@ class BaseBitvector(SSZModel):
                 f"{cls.__name__} requires exactly {cls.LENGTH} elements, got {len(bits_input)}"
             )
 
-        # Wrap each value in Boolean — the constructor rejects anything outside 0 or 1.
-        return tuple(Boolean(bit) for bit in bits_input)
+        # Wrap each value in Boolean — anything outside 0 or 1 is rejected.
+        return _coerce_bits(bits_input)
+
+    def __hash__(self) -> int:
+        """Hash the bits as one byte string, one byte per bit."""
+        return _hash_bits(type(self), self.data)
 
     @classmethod
     @override
@@ -185,7 +217,7 @@ class BaseBitvector(SSZModel):
         #   i=8:  (data[1] >> 0) & 1  =  0b00000001 & 1  =  1
         #
         # Recovered bits: [1, 0, 1, 0, 0, 0, 0, 0, 1]
-        return cls(data=[Boolean((data[i // 8] >> (i % 8)) & 1) for i in range(cls.LENGTH)])
+        return cls(data=[_BOOLEAN_BY_BIT[(data[i // 8] >> (i % 8)) & 1] for i in range(cls.LENGTH)])
 
 
 class BaseBitlist(SSZModel):
@@ -244,8 +276,12 @@ class BaseBitlist(SSZModel):
         if len(elements) > cls.LIMIT:
             raise SSZValueError(f"{cls.__name__} exceeds limit of {cls.LIMIT}, got {len(elements)}")
 
-        # Wrap each value in Boolean — the constructor rejects anything outside 0 or 1.
-        return tuple(Boolean(bit) for bit in elements)
+        # Wrap each value in Boolean — anything outside 0 or 1 is rejected.
+        return _coerce_bits(elements)
+
+    def __hash__(self) -> int:
+        """Hash the bits as one byte string, one byte per bit."""
+        return _hash_bits(type(self), self.data)
 
     @overload
     def __getitem__(self, key: int) -> Boolean: ...
@@ -441,4 +477,4 @@ class BaseBitlist(SSZModel):
         if num_bits > cls.LIMIT:
             raise SSZValueError(f"{cls.__name__} exceeds limit of {cls.LIMIT}, got {num_bits}")
 
-        return cls(data=[Boolean((data[i // 8] >> (i % 8)) & 1) for i in range(num_bits)])
+        return cls(data=[_BOOLEAN_BY_BIT[(data[i // 8] >> (i % 8)) & 1] for i in range(num_bits)])
@@ -234,7 +234,9 @@ class BaseBytes(bytes, SSZType):
 
     def __hash__(self) -> int:
         """Return a hash distinct from raw bytes — matches the strict equality contract."""
-        return hash((type(self), bytes(self)))
+        # Roots are dictionary keys throughout fork choice, so this runs on every lookup.
+        # Hash the bytes in place: converting to plain bytes would copy the value each time.
+        return hash((type(self), bytes.__hash__(self)))
 
 
 class Bytes4(BaseBytes):
@@ -11,12 +11,12 @@ if "LEAN_ENV" not in os.environ:
     os.environ["LEAN_ENV"] = "test"
 
 from consensus_testing import (  # noqa: E402
+    build_anchor,
     build_genesis_state,
-    build_genesis_store,
     reconstruct_block_from_header,
 )
 from consensus_testing.keys import XmssKeyManager  # noqa: E402
-from lean_spec.spec.forks import Slot  # noqa: E402
+from lean_spec.spec.forks import Slot, ValidatorIndex  # noqa: E402
 from lean_spec.spec.forks.lstar import State, Store  # noqa: E402
 from lean_spec.spec.forks.lstar.containers import Block  # noqa: E402
 from lean_spec.spec.forks.lstar.spec import LstarSpec  # noqa: E402
@@ -32,31 +32,40 @@ def spec() -> LstarSpec:
     return LstarSpec()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def key_manager() -> XmssKeyManager:
-    """XMSS key manager for signing attestations."""
+    """XMSS key manager for signing attestations, shared across the session."""
     return XmssKeyManager.shared(max_slot=Slot(20))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def genesis_state() -> State:
-    """Genesis state with 3 null-key validators at time 0."""
+    """Genesis state with 3 null-key validators at time 0, built once and shared."""
+    # States are frozen, so one instance can serve every test.
     return build_genesis_state(num_validators=3, keyed=False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def genesis_block(genesis_state: State) -> Block:
-    """Genesis block matching the null-key genesis state."""
+    """Genesis block matching the null-key genesis state, built once and shared."""
     return reconstruct_block_from_header(genesis_state)
 
 
 @pytest.fixture
-def base_store() -> Store:
+def base_store(spec: LstarSpec, genesis_state: State, genesis_block: Block) -> Store:
     """Fork choice store on null-key genesis with 3 validators."""
-    return build_genesis_store(num_validators=3, keyed=False)
+    # The genesis pair is shared; only the store and its mutable maps are per test.
+    return spec.create_store(genesis_state, genesis_block, validator_index=ValidatorIndex(0))
+
+
+@pytest.fixture(scope="session")
+def keyed_genesis() -> tuple[State, Block]:
+    """Keyed genesis state and block with 8 validators, built once and shared."""
+    return build_anchor(8, Slot(0))
 
 
 @pytest.fixture
-def keyed_store() -> Store:
+def keyed_store(spec: LstarSpec, keyed_genesis: tuple[State, Block]) -> Store:
     """Fork choice store on keyed genesis with 8 validators, owned by validator 0."""
-    return build_genesis_store(num_validators=8)
+    state, block = keyed_genesis
+    return spec.create_store(state, block, validator_index=ValidatorIndex(0))
@@ -26,12 +26,12 @@ pytestmark = pytest.mark.valid_until("Lstar")
 
 def _zero_hash_digest_vector() -> HashDigestVector:
     """Build a hash digest vector with all field elements set to zero."""
-    return HashDigestVector(data=[Fp(0) for _ in range(TARGET_CONFIG.HASH_LENGTH_FIELD_ELEMENTS)])
+    return HashDigestVector(data=[Fp(0)] * TARGET_CONFIG.HASH_LENGTH_FIELD_ELEMENTS)
 
 
 def _zero_parameter() -> Parameter:
     """Build a parameter vector with all field elements set to zero."""
-    return Parameter(data=[Fp(0) for _ in range(Parameter.LENGTH)])
+    return Parameter(data=[Fp(0)] * Parameter.LENGTH)
 
 
 def test_public_key_zero(ssz_test: SSZTestFiller) -> None:
@@ -35,7 +35,6 @@ from lean_spec.node.networking.gossipsub.rpc import (
 )
 from lean_spec.node.networking.gossipsub.types import MessageId, Timestamp, TopicId
 from lean_spec.node.networking.varint import encode_varint
-from lean_spec.node.snappy import compress as snappy_compress
 from tests.node.networking.gossipsub.conftest import add_peer, make_behavior, make_peer
 
 
@@ -526,7 +525,17 @@ class TestHandleMessage:
 
         # Highly compressible bytes that expand one byte past the 10 MiB cap.
         oversized_payload = b"\x00" * (MAX_PAYLOAD_SIZE + 1)
-        compressed_payload = snappy_compress(oversized_payload)
+
+        # Write the Snappy block by hand instead of running the compressor over 10 MiB:
+        #
+        #     length header  :  varint(MAX_PAYLOAD_SIZE + 1)
+        #     literal        :  00 00         (tag for a 1-byte literal, then the zero byte)
+        #     copy, repeated :  fe 01 00      (copy 64 bytes from offset 1)
+        compressed_payload = (
+            encode_varint(len(oversized_payload))
+            + b"\x00\x00"
+            + b"\xfe\x01\x00" * (MAX_PAYLOAD_SIZE // 64)
+        )
         message = Message(topic=topic, data=compressed_payload)
         message_id = GossipsubMessage.compute_id(topic.encode("utf-8"), oversized_payload)
         await behavior._handle_message(peer_id, message)
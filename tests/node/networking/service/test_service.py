@@ -44,21 +44,23 @@ from lean_spec.spec.ssz import Bytes32
 
 FORK_DIGEST = "0x12345678"
 
+SLOT_ONE_ATTESTATION_DATA = AttestationData(
+    slot=Slot(1),
+    head=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
+    target=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
+    source=Checkpoint(root=Bytes32.zero(), slot=Slot(0)),
+)
+"""Slot-1 vote shared by the attestation tests; containers are frozen, so sharing is safe."""
+
 # Helpers
 
 
 def _sample_signed_aggregate() -> SignedAggregatedAttestation:
     """Build a signed aggregated attestation for validator 0 over a slot-1 vote."""
     key_manager = XmssKeyManager.shared()
-    attestation_data = AttestationData(
-        slot=Slot(1),
-        head=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
-        target=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
-        source=Checkpoint(root=Bytes32.zero(), slot=Slot(0)),
-    )
     return SignedAggregatedAttestation(
-        data=attestation_data,
-        proof=key_manager.sign_and_aggregate([ValidatorIndex(0)], attestation_data),
+        data=SLOT_ONE_ATTESTATION_DATA,
+        proof=key_manager.sign_and_aggregate([ValidatorIndex(0)], SLOT_ONE_ATTESTATION_DATA),
     )
 
 
@@ -252,12 +254,7 @@ class TestSecondaryEventDispatch:
         sync_service = create_mock_sync_service(peer_id)
         attestation = SignedAttestation(
             validator_index=ValidatorIndex(1),
-            data=AttestationData(
-                slot=Slot(1),
-                head=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
-                target=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
-                source=Checkpoint(root=Bytes32.zero(), slot=Slot(0)),
-            ),
+            data=SLOT_ONE_ATTESTATION_DATA,
             signature=create_dummy_signature(),
         )
         topic = GossipTopic.attestation_subnet(FORK_DIGEST, SubnetId(0))
@@ -401,12 +398,7 @@ class TestPublishAttestation:
         svc, source = _make_network_service([], peer_id=peer_id)
         attestation = SignedAttestation(
             validator_index=ValidatorIndex(0),
-            data=AttestationData(
-                slot=Slot(1),
-                head=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
-                target=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
-                source=Checkpoint(root=Bytes32.zero(), slot=Slot(0)),
-            ),
+            data=SLOT_ONE_ATTESTATION_DATA,
             signature=create_dummy_signature(),
         )
 
@@ -618,12 +610,7 @@ class TestAttestationRoutingToForkchoice:
 
         attestation = SignedAttestation(
             validator_index=ValidatorIndex(42),
-            data=AttestationData(
-                slot=Slot(1),
-                head=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
-                target=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
-                source=Checkpoint(root=Bytes32.zero(), slot=Slot(0)),
-            ),
+            data=SLOT_ONE_ATTESTATION_DATA,
             signature=create_dummy_signature(),
         )
 
@@ -665,12 +652,7 @@ class TestAttestationRoutingToForkchoice:
 
         attestation = SignedAttestation(
             validator_index=ValidatorIndex(99),
-            data=AttestationData(
-                slot=Slot(1),
-                head=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
-                target=Checkpoint(root=Bytes32.zero(), slot=Slot(1)),
-                source=Checkpoint(root=Bytes32.zero(), slot=Slot(0)),
-            ),
+            data=SLOT_ONE_ATTESTATION_DATA,
             signature=create_dummy_signature(),
         )
 
@@ -92,30 +92,30 @@ class TestSelfPatternExtension:
             compressed = compress(pattern)
             assert decompress(compressed) == pattern
 
-    def test_exhaustive_self_patterns(self) -> None:
+    @pytest.mark.parametrize("pattern_size", range(1, 19))
+    def test_exhaustive_self_patterns(self, pattern_size: int) -> None:
         """Exhaustive test of self-extending patterns with various sizes."""
         random.seed(42)  # Deterministic for reproducibility
 
-        for pattern_size in range(1, 19):
-            for length in range(1, 65):
-                for extra_bytes in [0, 1, 15, 16, 128]:
-                    size = pattern_size + length + extra_bytes
-                    uncompressed = bytearray(size)
+        for length in range(1, 65):
+            for extra_bytes in [0, 1, 15, 16, 128]:
+                size = pattern_size + length + extra_bytes
+                uncompressed = bytearray(size)
 
-                    # Build pattern
-                    for i in range(pattern_size):
-                        uncompressed[i] = ord("a") + i
+                # Build pattern
+                for i in range(pattern_size):
+                    uncompressed[i] = ord("a") + i
 
-                    # Repeat pattern
-                    for i in range(length):
-                        uncompressed[pattern_size + i] = uncompressed[i % pattern_size]
+                # Repeat pattern
+                for i in range(length):
+                    uncompressed[pattern_size + i] = uncompressed[i % pattern_size]
 
-                    # Random suffix
-                    for i in range(extra_bytes):
-                        uncompressed[pattern_size + length + i] = random.randint(0, 255)
+                # Random suffix
+                for i in range(extra_bytes):
+                    uncompressed[pattern_size + length + i] = random.randint(0, 255)
 
-                    compressed = compress(bytes(uncompressed))
-                    assert decompress(compressed) == bytes(uncompressed)
+                compressed = compress(bytes(uncompressed))
+                assert decompress(compressed) == bytes(uncompressed)
 
 
 class TestMaxBlowup:
@@ -24,6 +24,9 @@ from lean_spec.spec.forks.lstar.containers import (
 )
 from lean_spec.spec.ssz import Bytes32, Uint64
 
+# Bodies are frozen, so every block built here can share one empty body.
+_EMPTY_BODY = BlockBody(attestations=AggregatedAttestations(data=[]))
+
 
 @pytest.fixture
 def db() -> Generator[SQLiteDatabase, None, None]:
@@ -56,7 +59,7 @@ class TestBlockOperations:
             proposer_index=ValidatorIndex(0),
             parent_root=Bytes32.zero(),
             state_root=hash_tree_root(genesis_state),
-            body=BlockBody(attestations=AggregatedAttestations(data=[])),
+            body=_EMPTY_BODY,
         )
         root = hash_tree_root(block1)
 
@@ -383,14 +386,15 @@ class TestMultiBlockChain:
         """Store a chain of 3 blocks with slot indices, verify all retrievable."""
         blocks: list[tuple[Block, Bytes32]] = []
 
+        state_root = hash_tree_root(genesis_state)
         for i in range(3):
             parent_root = blocks[-1][1] if blocks else Bytes32.zero()
             block = Block(
                 slot=Slot(i),
                 proposer_index=ValidatorIndex(0),
                 parent_root=parent_root,
-                state_root=hash_tree_root(genesis_state),
-                body=BlockBody(attestations=AggregatedAttestations(data=[])),
+                state_root=state_root,
+                body=_EMPTY_BODY,
             )
             root = hash_tree_root(block)
             blocks.append((block, root))
@@ -424,13 +428,14 @@ class TestPruning:
         """Prune removes entries below the given slot."""
         blocks: list[tuple[Block, Bytes32]] = []
 
+        state_root = hash_tree_root(genesis_state)
         for i in range(5):
             block = Block(
                 slot=Slot(i),
                 proposer_index=ValidatorIndex(0),
                 parent_root=blocks[-1][1] if blocks else Bytes32.zero(),
-                state_root=hash_tree_root(genesis_state),
-                body=BlockBody(attestations=AggregatedAttestations(data=[])),
+                state_root=state_root,
+                body=_EMPTY_BODY,
             )
             root = hash_tree_root(block)
             blocks.append((block, root))
@@ -460,13 +465,14 @@ class TestPruning:
         """Prune preserves blocks/states whose roots are in keep_roots."""
         blocks: list[tuple[Block, Bytes32]] = []
 
+        state_root = hash_tree_root(genesis_state)
         for i in range(3):
             block = Block(
                 slot=Slot(i),
                 proposer_index=ValidatorIndex(0),
                 parent_root=blocks[-1][1] if blocks else Bytes32.zero(),
-                state_root=hash_tree_root(genesis_state),
-                body=BlockBody(attestations=AggregatedAttestations(data=[])),
+                state_root=state_root,
+                body=_EMPTY_BODY,
             )
             root = hash_tree_root(block)
             blocks.append((block, root))
@@ -498,7 +504,7 @@ class TestPruning:
             proposer_index=ValidatorIndex(0),
             parent_root=Bytes32.zero(),
             state_root=hash_tree_root(genesis_state),
-            body=BlockBody(attestations=AggregatedAttestations(data=[])),
+            body=_EMPTY_BODY,
         )
         root = hash_tree_root(block)
 
@@ -526,7 +532,7 @@ class TestPruning:
             proposer_index=ValidatorIndex(0),
             parent_root=Bytes32.zero(),
             state_root=hash_tree_root(genesis_state),
-            body=BlockBody(attestations=AggregatedAttestations(data=[])),
+            body=_EMPTY_BODY,
         )
         block_root = hash_tree_root(block)
         state_root = Bytes32(b"\x0d" * 32)
@@ -550,7 +556,7 @@ class TestPruning:
             proposer_index=ValidatorIndex(0),
             parent_root=Bytes32.zero(),
             state_root=hash_tree_root(genesis_state),
-            body=BlockBody(attestations=AggregatedAttestations(data=[])),
+            body=_EMPTY_BODY,
         )
         block_root = hash_tree_root(block)
 
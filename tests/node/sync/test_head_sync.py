@@ -39,17 +39,34 @@ def _null_backfill() -> BackfillSync:
     return cast(BackfillSync, NullBackfillSync())
 
 
+def _build_chain(parent_root: Bytes32, length: int) -> list[tuple[SignedBlock, Bytes32]]:
+    """Build a linear chain of blocks at slots 1 through length, each paired with its root."""
+    chain: list[tuple[SignedBlock, Bytes32]] = []
+    for slot in range(1, length + 1):
+        block = make_signed_block(
+            slot=Slot(slot),
+            proposer_index=ValidatorIndex(0),
+            parent_root=parent_root,
+            state_root=Bytes32(bytes([slot]) * 32),
+        )
+        # Each root is hashed once and doubles as the next block's parent.
+        parent_root = hash_tree_root(block.block)
+        chain.append((block, parent_root))
+    return chain
+
+
+@pytest.fixture
+def genesis_setup(genesis_block) -> tuple[Bytes32, Store]:
+    """Provide genesis root and store with genesis block."""
+    genesis_root = hash_tree_root(genesis_block)
+    store = MockForkchoiceStore()
+    store.blocks[genesis_root] = genesis_block
+    return genesis_root, cast(Store, store)
+
+
 class TestGossipBlockProcessing:
     """Tests for processing gossip blocks with known parents."""
 
-    @pytest.fixture
-    def genesis_setup(self, genesis_block) -> tuple[Bytes32, Store]:
-        """Provide genesis root and store with genesis block."""
-        genesis_root = hash_tree_root(genesis_block)
-        store = MockForkchoiceStore()
-        store.blocks[genesis_root] = genesis_block
-        return genesis_root, cast(Store, store)
-
     async def test_block_with_known_parent_processed_immediately(
         self,
         genesis_setup: tuple[Bytes32, Store],
@@ -158,31 +175,15 @@ class TestDescendantProcessing:
 
     async def test_cached_children_processed_when_parent_arrives(
         self,
-        genesis_block,
+        genesis_setup: tuple[Bytes32, Store],
         peer_id: PeerId,
     ) -> None:
         """When a parent block is processed, its cached children are processed too."""
-        genesis_root = hash_tree_root(genesis_block)
-        store = cast(Store, MockForkchoiceStore())
-        store.blocks[genesis_root] = genesis_block
+        genesis_root, store = genesis_setup
         block_cache = BlockCache()
 
         # Create parent and child
-        parent = make_signed_block(
-            slot=Slot(1),
-            proposer_index=ValidatorIndex(0),
-            parent_root=genesis_root,
-            state_root=Bytes32(b"\x01" * 32),
-        )
-        parent_root = hash_tree_root(parent.block)
-
-        child = make_signed_block(
-            slot=Slot(2),
-            proposer_index=ValidatorIndex(0),
-            parent_root=parent_root,
-            state_root=Bytes32(b"\x02" * 32),
-        )
-        child_root = hash_tree_root(child.block)
+        (parent, parent_root), (child, child_root) = _build_chain(genesis_root, 2)
 
         # Pre-cache the child (waiting for parent)
         block_cache.add(child, peer_id)
@@ -212,27 +213,15 @@ class TestDescendantProcessing:
 
     async def test_chain_of_descendants_processed_in_slot_order(
         self,
-        genesis_block,
+        genesis_setup: tuple[Bytes32, Store],
         peer_id: PeerId,
     ) -> None:
         """Deep chain of descendants is processed in correct slot order."""
-        genesis_root = hash_tree_root(genesis_block)
-        store = cast(Store, MockForkchoiceStore())
-        store.blocks[genesis_root] = genesis_block
+        genesis_root, store = genesis_setup
         block_cache = BlockCache()
 
         # Create chain: slot1 -> slot2 -> slot3 -> slot4
-        blocks = []
-        parent_root = genesis_root
-        for i in range(1, 5):
-            block = make_signed_block(
-                slot=Slot(i),
-                proposer_index=ValidatorIndex(0),
-                parent_root=parent_root,
-                state_root=Bytes32(bytes([i]) * 32),
-            )
-            blocks.append(block)
-            parent_root = hash_tree_root(block.block)
+        blocks = [block for block, _ in _build_chain(genesis_root, 4)]
 
         # Cache all except the first (which will be gossiped)
         for block in blocks[1:]:
@@ -266,13 +255,11 @@ class TestErrorHandling:
 
     async def test_processing_error_reported_as_not_processed(
         self,
-        genesis_block,
+        genesis_setup: tuple[Bytes32, Store],
         peer_id: PeerId,
     ) -> None:
         """Processing errors are swallowed, reported as not processed, never raised."""
-        genesis_root = hash_tree_root(genesis_block)
-        store = cast(Store, MockForkchoiceStore())
-        store.blocks[genesis_root] = genesis_block
+        genesis_root, store = genesis_setup
 
         def fail_processing(s: Any, b: SignedBlock) -> Any:
             raise Exception("State transition failed")
@@ -300,39 +287,17 @@ class TestStorePropagation:
 
     async def test_store_propagated_through_descendant_chain(
         self,
-        genesis_block,
+        genesis_setup: tuple[Bytes32, Store],
         peer_id: PeerId,
     ) -> None:
         """Returned store contains ALL processed blocks, not just the parent."""
-        genesis_root = hash_tree_root(genesis_block)
-        store = cast(Store, MockForkchoiceStore())
-        store.blocks[genesis_root] = genesis_block
+        genesis_root, store = genesis_setup
         block_cache = BlockCache()
 
         # Build chain: parent -> child1 -> child2
-        parent = make_signed_block(
-            slot=Slot(1),
-            proposer_index=ValidatorIndex(0),
-            parent_root=genesis_root,
-            state_root=Bytes32(b"\x01" * 32),
-        )
-        parent_root = hash_tree_root(parent.block)
-
-        child1 = make_signed_block(
-            slot=Slot(2),
-            proposer_index=ValidatorIndex(0),
-            parent_root=parent_root,
-            state_root=Bytes32(b"\x02" * 32),
-        )
-        child1_root = hash_tree_root(child1.block)
-
-        child2 = make_signed_block(
-            slot=Slot(3),
-            proposer_index=ValidatorIndex(0),
-            parent_root=child1_root,
-            state_root=Bytes32(b"\x03" * 32),
+        (parent, parent_root), (child1, child1_root), (child2, child2_root) = _build_chain(
+            genesis_root, 3
         )
-        child2_root = hash_tree_root(child2.block)
 
         # Pre-cache descendants.
         block_cache.add(child1, peer_id)
@@ -873,19 +873,14 @@ BLOCK_SLOT = Slot(2)
 BLOCK_PROPOSER = ValidatorIndex(2)
 
 
-def _setup(
-    key_manager: XmssKeyManager,
-    *,
-    block_participants: list[ValidatorIndex],
-):
+@pytest.fixture(scope="module")
+def slot_one_chain(key_manager: XmssKeyManager) -> tuple[Store, Bytes32]:
     """
-    Build a two-block chain and a signed block carrying an attestation.
+    Store holding an honestly signed slot-1 block, with that block's root.
 
-    The chain block sits at slot 1. The returned signed block sits at slot
-    2 and carries one attestation whose target is the slot-1 block, ahead
-    of the still-genesis justified checkpoint. The returned store holds the
-    slot-1 block and its state (the parent state the multi-message aggregate public_key layout
-    is resolved against) with the justified checkpoint still at genesis.
+    Producing and aggregating the block is the costly part of every setup below.
+    The result is identical for each test, and stores are frozen, so it is built once.
+    The justified checkpoint is still at genesis.
     """
     spec = LstarSpec()
     base_store = build_genesis_store(
@@ -895,8 +890,25 @@ def _setup(
     consumer_store, chain_block = make_signed_block_from_store(
         base_store, key_manager, CHAIN_SLOT, CHAIN_PROPOSER
     )
-    chain_store = spec.on_block(consumer_store, chain_block)
-    chain_root = hash_tree_root(chain_block.block)
+    return spec.on_block(consumer_store, chain_block), hash_tree_root(chain_block.block)
+
+
+def _setup(
+    slot_one_chain: tuple[Store, Bytes32],
+    key_manager: XmssKeyManager,
+    *,
+    block_participants: list[ValidatorIndex],
+):
+    """
+    Build a signed block carrying an attestation on top of the slot-1 chain.
+
+    The returned signed block sits at slot 2 and carries one attestation
+    whose target is the slot-1 block, ahead of the still-genesis justified
+    checkpoint. The returned store holds the slot-1 block and its state (the
+    parent state the multi-message aggregate public_key layout is resolved
+    against) with the justified checkpoint still at genesis.
+    """
+    chain_store, chain_root = slot_one_chain
 
     # Target the slot-1 block; source stays at the genesis justified
     # checkpoint so the builder accepts the attestation.
@@ -924,7 +936,7 @@ def _service(peer_id: PeerId):
 
 
 def test_skips_when_target_not_ahead_of_justified(
-    peer_id: PeerId, key_manager: XmssKeyManager
+    peer_id: PeerId, key_manager: XmssKeyManager, slot_one_chain: tuple[Store, Bytes32]
 ) -> None:
     """
     Target at or behind the justified checkpoint -> no aggregates.
@@ -933,7 +945,7 @@ def test_skips_when_target_not_ahead_of_justified(
     split is never attempted and the store is returned unchanged.
     """
     chain_store, signed_block, attestation_data = _setup(
-        key_manager, block_participants=[ValidatorIndex(1), ValidatorIndex(2)]
+        slot_one_chain, key_manager, block_participants=[ValidatorIndex(1), ValidatorIndex(2)]
     )
     # Justified now sits at the attestation's target slot.
     store = chain_store.model_copy(update={"latest_justified": attestation_data.target})
@@ -946,7 +958,7 @@ def test_skips_when_target_not_ahead_of_justified(
 
 
 def test_skips_when_block_adds_no_new_validators(
-    peer_id: PeerId, key_manager: XmssKeyManager
+    peer_id: PeerId, key_manager: XmssKeyManager, slot_one_chain: tuple[Store, Bytes32]
 ) -> None:
     """
     Block participants are a subset of the local union -> no aggregates.
@@ -956,7 +968,7 @@ def test_skips_when_block_adds_no_new_validators(
     """
     block_participants = [ValidatorIndex(1), ValidatorIndex(2)]
     chain_store, signed_block, attestation_data = _setup(
-        key_manager, block_participants=block_participants
+        slot_one_chain, key_manager, block_participants=block_participants
     )
 
     local_partial = key_manager.sign_and_aggregate(
@@ -974,10 +986,12 @@ def test_skips_when_block_adds_no_new_validators(
     assert new_store is store
 
 
-def test_noop_when_parent_state_missing(peer_id: PeerId, key_manager: XmssKeyManager) -> None:
+def test_noop_when_parent_state_missing(
+    peer_id: PeerId, key_manager: XmssKeyManager, slot_one_chain: tuple[Store, Bytes32]
+) -> None:
     """Without the parent state the public_key layout cannot be resolved -> no-op."""
     chain_store, signed_block, _ = _setup(
-        key_manager, block_participants=[ValidatorIndex(1), ValidatorIndex(2)]
+        slot_one_chain, key_manager, block_participants=[ValidatorIndex(1), ValidatorIndex(2)]
     )
     store = chain_store.model_copy(update={"states": {}})
     service = _service(peer_id)
@@ -817,11 +817,6 @@ class TestValidatorServiceIntegration:
     All signatures are cryptographically valid and verifiable.
     """
 
-    @pytest.fixture
-    def key_manager(self) -> XmssKeyManager:
-        """Key manager with pre-generated test keys."""
-        return XmssKeyManager.shared(max_slot=Slot(10))
-
     @pytest.fixture
     def real_store(self, key_manager: XmssKeyManager) -> Store:
         """Forkchoice store with validators using real public keys."""
@@ -915,7 +910,7 @@ class TestValidatorServiceIntegration:
 
         for signed_attestation in attestations_produced:
             validator_index = signed_attestation.validator_index
-            public_key = key_manager[validator_index].attestation_keypair.public_key
+            public_key = key_manager.get_public_keys(validator_index)[0]
             message_bytes = hash_tree_root(signed_attestation.data)
 
             is_valid = TARGET_SIGNATURE_SCHEME.verify(
@@ -1012,7 +1007,7 @@ class TestValidatorServiceIntegration:
         for validator_index in participants:
             signature = key_manager.sign_attestation_data(validator_index, attestation_data)
             signatures.append(signature)
-            public_keys.append(key_manager[validator_index].attestation_keypair.public_key)
+            public_keys.append(key_manager.get_public_keys(validator_index)[0])
 
         proof = SingleMessageAggregate.aggregate(
             children=[],
@@ -1100,7 +1095,7 @@ class TestValidatorServiceIntegration:
                 source=Checkpoint(root=source_root, slot=Slot(src_slot)),
             )
             participants = [ValidatorIndex(i) for i in range(4)]
-            public_keys = [key_manager[v].attestation_keypair.public_key for v in participants]
+            public_keys = [key_manager.get_public_keys(v)[0] for v in participants]
             sigs = [key_manager.sign_attestation_data(v, data) for v in participants]
             proof = SingleMessageAggregate.aggregate(
                 children=[],
@@ -1281,7 +1276,7 @@ class TestValidatorServiceIntegration:
 
         for signed_attestation in attestations_produced:
             validator_index = signed_attestation.validator_index
-            public_key = key_manager[validator_index].attestation_keypair.public_key
+            public_key = key_manager.get_public_keys(validator_index)[0]
             message_bytes = hash_tree_root(signed_attestation.data)
 
             is_valid = TARGET_SIGNATURE_SCHEME.verify(
@@ -308,6 +308,12 @@ class Uint16Vector16(SSZVector[Uint16]):
     LENGTH = 16
 
 
+class FpVector9(SSZVector[Fp]):
+    """Nine KoalaBear field elements spilling one element into a second chunk."""
+
+    LENGTH = 9
+
+
 class Bytes32Vector3(SSZVector[Bytes32]):
     """Vector of three composite Bytes32 elements."""
 
@@ -632,6 +638,13 @@ def test_hash_tree_root_vector_single_element() -> None:
     assert hash_tree_root(vector) == pad(b"\xcd\xab")
 
 
+def test_hash_tree_root_vector_fp_elements() -> None:
+    """A vector of field elements packs each as a four-byte little-endian word."""
+    vector = FpVector9(data=[Fp(i * 0x01020304) for i in range(9)])
+    packed_bytes = b"".join(int(element).to_bytes(4, "little") for element in vector)
+    assert hash_tree_root(vector) == h(Bytes32(packed_bytes[:32]), pad(packed_bytes[32:]))
+
+
 def test_hash_tree_root_vector_composite_elements() -> None:
     """A vector of three Bytes32 leaves merkleizes its element roots padded to width four."""
     leaf_a = Bytes32(b"\xbb\xaa" + b"\x00" * 30)
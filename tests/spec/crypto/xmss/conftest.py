@@ -0,0 +1,19 @@
+"""Shared pytest fixtures for XMSS tests."""
+
+import pytest
+
+from lean_spec.spec.crypto.xmss.containers import KeyPair
+from lean_spec.spec.crypto.xmss.interface import TEST_SIGNATURE_SCHEME
+from lean_spec.spec.forks import Slot
+from lean_spec.spec.ssz import Uint64
+
+
+@pytest.fixture(scope="session")
+def signed_key_pair() -> KeyPair:
+    """
+    A key pair generated directly from the test scheme, active for slots 0 to 31.
+
+    Key generation dominates these tests, so the pair is built once per session.
+    Signing never mutates the secret key, so sharing it across tests is safe.
+    """
+    return TEST_SIGNATURE_SCHEME.key_gen(Slot(0), Uint64(32))
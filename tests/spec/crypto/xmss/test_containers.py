@@ -19,7 +19,7 @@ from lean_spec.spec.crypto.xmss.containers import (
 from lean_spec.spec.crypto.xmss.interface import TEST_SIGNATURE_SCHEME
 from lean_spec.spec.crypto.xmss.types import HashDigestList, HashTreeOpening
 from lean_spec.spec.forks import Slot, ValidatorIndex
-from lean_spec.spec.ssz import Bytes32, Uint64
+from lean_spec.spec.ssz import Bytes32
 from lean_spec.spec.ssz.exceptions import SSZSerializationError
 from lean_spec.spec.ssz.ssz_base import BYTES_PER_LENGTH_OFFSET
 from lean_spec.spec.ssz.uint import Uint32
@@ -285,12 +285,6 @@ def test_keypair_rejects_invalid_secret_key_hex(keypair_a: KeyPair) -> None:
         )
 
 
-@pytest.fixture(scope="module")
-def signed_key_pair() -> KeyPair:
-    """A key pair generated directly from the test scheme."""
-    return TEST_SIGNATURE_SCHEME.key_gen(Slot(0), Uint64(32))
-
-
 @pytest.fixture(scope="module")
 def sample_signature(signed_key_pair: KeyPair) -> Signature:
     """A signature over a fixed message at slot zero."""
@@ -93,7 +93,12 @@ def test_message_hash_yields_valid_codeword() -> None:
     randomness = Randomness(data=random_field_elements(config.RAND_LENGTH_FIELD_ELEMENTS))
 
     codeword = message_hash(
-        POSEIDON, config, parameter, Uint64(313), randomness, Bytes32(b"\xaa" * 32)
+        POSEIDON,
+        config,
+        parameter,
+        encode_epoch(config, Uint64(313)),
+        randomness,
+        encode_message(config, Bytes32(b"\xaa" * 32)),
     )
 
     assert codeword is not None
@@ -108,7 +113,14 @@ def test_target_sum_encode_accepts_codeword_on_target_layer() -> None:
     # Attempt counter three lands the all-zero message on the target-sum layer.
     rho = Randomness(data=int_to_base_p(3, config.RAND_LENGTH_FIELD_ELEMENTS))
 
-    codeword = target_sum_encode(POSEIDON, config, parameter, Uint64(0), rho, Bytes32(b"\x00" * 32))
+    codeword = target_sum_encode(
+        POSEIDON,
+        config,
+        parameter,
+        encode_epoch(config, Uint64(0)),
+        rho,
+        encode_message(config, Bytes32(b"\x00" * 32)),
+    )
 
     # The digits sum to the target of six, landing on the accepted layer.
     assert codeword == [3, 0, 3, 0]
@@ -122,7 +134,14 @@ def test_target_sum_encode_rejects_codeword_off_target_layer() -> None:
     rho = Randomness(data=int_to_base_p(0, config.RAND_LENGTH_FIELD_ELEMENTS))
 
     assert (
-        target_sum_encode(POSEIDON, config, parameter, Uint64(0), rho, Bytes32(b"\x00" * 32))
+        target_sum_encode(
+            POSEIDON,
+            config,
+            parameter,
+            encode_epoch(config, Uint64(0)),
+            rho,
+            encode_message(config, Bytes32(b"\x00" * 32)),
+        )
         is None
     )
 
@@ -144,9 +163,9 @@ def test_target_sum_encode_propagates_aborting_decode_failure(
             POSEIDON,
             TEST_CONFIG,
             _parameter(),
-            Uint64(0),
+            encode_epoch(TEST_CONFIG, Uint64(0)),
             Randomness(data=int_to_base_p(0, TEST_CONFIG.RAND_LENGTH_FIELD_ELEMENTS)),
-            Bytes32(b"\x00" * 32),
+            encode_message(TEST_CONFIG, Bytes32(b"\x00" * 32)),
         )
         is None
     )
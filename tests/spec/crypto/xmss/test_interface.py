@@ -3,7 +3,8 @@
 import pytest
 
 from lean_spec.spec.crypto.xmss import interface
-from lean_spec.spec.crypto.xmss.encoding import target_sum_encode
+from lean_spec.spec.crypto.xmss.containers import KeyPair
+from lean_spec.spec.crypto.xmss.encoding import encode_epoch, encode_message, target_sum_encode
 from lean_spec.spec.crypto.xmss.interface import (
     TEST_SIGNATURE_SCHEME,
     GeneralizedXmssScheme,
@@ -60,15 +61,20 @@ def _test_correctness_roundtrip(
     #
     # We detect this by checking if both messages encode to the same codeword.
     original_codeword = target_sum_encode(
-        scheme.poseidon, scheme.config, public_key.parameter, test_slot, signature.rho, message
+        scheme.poseidon,
+        scheme.config,
+        public_key.parameter,
+        encode_epoch(scheme.config, test_slot),
+        signature.rho,
+        encode_message(scheme.config, message),
     )
     tampered_codeword = target_sum_encode(
         scheme.poseidon,
         scheme.config,
         public_key.parameter,
-        test_slot,
+        encode_epoch(scheme.config, test_slot),
         signature.rho,
-        tampered_message,
+        encode_message(scheme.config, tampered_message),
     )
 
     if tampered_codeword != original_codeword:
@@ -123,11 +129,10 @@ def test_get_activation_interval() -> None:
     assert interval.stop >= 12
 
 
-def test_get_prepared_interval() -> None:
+def test_get_prepared_interval(signed_key_pair: KeyPair) -> None:
     """Tests that get_prepared_interval returns the correct range."""
     scheme = TEST_SIGNATURE_SCHEME
-    # Use full lifetime
-    secret_key = scheme.key_gen(Slot(0), Uint64(16)).secret_key
+    secret_key = signed_key_pair.secret_key
 
     interval = scheme.get_prepared_interval(secret_key)
 
@@ -197,11 +202,10 @@ def test_sign_requires_prepared_interval() -> None:
     )
 
 
-def test_deterministic_signing() -> None:
+def test_deterministic_signing(signed_key_pair: KeyPair) -> None:
     """Tests that signing the same message with the same key produces the same signature."""
     scheme = TEST_SIGNATURE_SCHEME
-    # Use full lifetime
-    secret_key = scheme.key_gen(Slot(0), Uint64(16)).secret_key
+    secret_key = signed_key_pair.secret_key
 
     # Use epoch within prepared interval
     epoch = Slot(4)
@@ -249,37 +253,46 @@ def test_key_gen_rejects_range_exceeding_lifetime() -> None:
     assert str(exception_info.value) == "Activation range exceeds the key's lifetime."
 
 
-def test_sign_rejects_slot_outside_activation() -> None:
+def test_sign_rejects_slot_outside_activation(signed_key_pair: KeyPair) -> None:
     """Signing a slot the key was never activated for is refused."""
-    secret_key = TEST_SIGNATURE_SCHEME.key_gen(Slot(0), Uint64(32)).secret_key
+    secret_key = signed_key_pair.secret_key
     with pytest.raises(ValueError) as exception_info:
         TEST_SIGNATURE_SCHEME.sign(secret_key, Slot(200), Bytes32(b"\x42" * 32))
     assert str(exception_info.value) == "Key is not active for the specified slot."
 
 
-def test_sign_raises_when_no_encoding_found(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_sign_raises_when_no_encoding_found(
+    monkeypatch: pytest.MonkeyPatch, signed_key_pair: KeyPair
+) -> None:
     """
     An encoding search that never succeeds raises after exhausting the attempts.
 
     The encoding is forced to always reject so the retry loop runs to its limit.
+    A small attempt budget keeps the exhaustive loop short.
     """
-    secret_key = TEST_SIGNATURE_SCHEME.key_gen(Slot(0), Uint64(32)).secret_key
+    secret_key = signed_key_pair.secret_key
     monkeypatch.setattr(interface, "target_sum_encode", lambda *args, **kwargs: None)
-    tries = TEST_SIGNATURE_SCHEME.config.MAX_TRIES
+    tries = 3
+    scheme = GeneralizedXmssScheme(
+        config=TEST_SIGNATURE_SCHEME.config.model_copy(update={"MAX_TRIES": tries}),
+        poseidon=TEST_SIGNATURE_SCHEME.poseidon,
+    )
     with pytest.raises(RuntimeError) as exception_info:
-        TEST_SIGNATURE_SCHEME.sign(secret_key, Slot(0), Bytes32(b"\x42" * 32))
+        scheme.sign(secret_key, Slot(0), Bytes32(b"\x42" * 32))
     assert str(exception_info.value) == (
         f"Failed to find a valid message encoding after {tries} tries."
     )
 
 
-def test_sign_raises_on_wrong_codeword_dimension(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_sign_raises_on_wrong_codeword_dimension(
+    monkeypatch: pytest.MonkeyPatch, signed_key_pair: KeyPair
+) -> None:
     """
     An encoding returning the wrong number of digits raises.
 
     The encoding is forced to return one digit too few for the scheme dimension.
     """
-    secret_key = TEST_SIGNATURE_SCHEME.key_gen(Slot(0), Uint64(32)).secret_key
+    secret_key = signed_key_pair.secret_key
     short = [0] * (TEST_SIGNATURE_SCHEME.config.DIMENSION - 1)
     monkeypatch.setattr(interface, "target_sum_encode", lambda *args, **kwargs: short)
     with pytest.raises(RuntimeError) as exception_info:
@@ -302,13 +315,10 @@ class TestVerifySecurityBounds:
     This prevents denial-of-service via malformed signatures.
     """
 
-    def test_rejects_slot_beyond_lifetime(self) -> None:
+    def test_rejects_slot_beyond_lifetime(self, signed_key_pair: KeyPair) -> None:
         """verify returns False when slot exceeds scheme LIFETIME."""
         scheme = TEST_SIGNATURE_SCHEME
-
-        # Generate valid keys.
-        key_pair = scheme.key_gen(Slot(0), Uint64(int(scheme.config.LIFETIME)))
-        public_key, secret_key = key_pair.public_key, key_pair.secret_key
+        public_key, secret_key = signed_key_pair.public_key, signed_key_pair.secret_key
 
         # Sign a valid message at a valid epoch.
         valid_epoch = Slot(4)
@@ -322,11 +332,10 @@ class TestVerifySecurityBounds:
         verification_passed = scheme.verify(public_key, invalid_epoch, message, signature)
         assert verification_passed is False
 
-    def test_rejects_very_large_slot(self) -> None:
+    def test_rejects_very_large_slot(self, signed_key_pair: KeyPair) -> None:
         """verify returns False for absurdly large slot values."""
         scheme = TEST_SIGNATURE_SCHEME
-        key_pair = scheme.key_gen(Slot(0), Uint64(int(scheme.config.LIFETIME)))
-        public_key, secret_key = key_pair.public_key, key_pair.secret_key
+        public_key, secret_key = signed_key_pair.public_key, signed_key_pair.secret_key
 
         valid_epoch = Slot(4)
         message = Bytes32(b"\x42" * 32)
@@ -339,11 +348,10 @@ class TestVerifySecurityBounds:
         is_valid = scheme.verify(public_key, huge_epoch, message, signature)
         assert is_valid is False
 
-    def test_rejects_signature_with_too_few_hashes(self) -> None:
+    def test_rejects_signature_with_too_few_hashes(self, signed_key_pair: KeyPair) -> None:
         """verify returns False when the released chain count is below DIMENSION."""
         scheme = TEST_SIGNATURE_SCHEME
-        key_pair = scheme.key_gen(Slot(0), Uint64(int(scheme.config.LIFETIME)))
-        public_key, secret_key = key_pair.public_key, key_pair.secret_key
+        public_key, secret_key = signed_key_pair.public_key, signed_key_pair.secret_key
 
         valid_epoch = Slot(4)
         message = Bytes32(b"\x42" * 32)
@@ -2,7 +2,7 @@
 
 import pytest
 
-from lean_spec.spec.crypto.koalabear import Fp
+from lean_spec.spec.crypto.koalabear import Fp, P
 from lean_spec.spec.crypto.xmss.constants import TEST_CONFIG
 from lean_spec.spec.crypto.xmss.field import random_domain
 from lean_spec.spec.crypto.xmss.types import (
@@ -16,7 +16,7 @@ from lean_spec.spec.crypto.xmss.types import (
     TreeTweak,
 )
 from lean_spec.spec.ssz import Uint64
-from lean_spec.spec.ssz.exceptions import SSZValueError
+from lean_spec.spec.ssz.exceptions import SSZSerializationError, SSZValueError
 
 
 def test_tree_tweak_fields() -> None:
@@ -51,6 +51,34 @@ def test_hash_digest_vector_rejects_wrong_length() -> None:
         HashDigestVector(data=[Fp(value=0)] * (TEST_CONFIG.HASH_LENGTH_FIELD_ELEMENTS + 1))
 
 
+def test_hash_digest_vector_encodes_little_endian_words() -> None:
+    """A digest vector encodes as packed four-byte little-endian words and decodes back."""
+    digest_elements = [Fp(value=P - 1 - i) for i in range(TEST_CONFIG.HASH_LENGTH_FIELD_ELEMENTS)]
+    digest = HashDigestVector(data=digest_elements)
+    encoded = digest.encode_bytes()
+    assert encoded == b"".join(int(element).to_bytes(4, "little") for element in digest_elements)
+    assert HashDigestVector.decode_bytes(encoded) == digest
+
+
+def test_hash_digest_vector_decode_rejects_word_at_modulus() -> None:
+    """Decoding reports the first word that is not a canonical field element."""
+    words = [1, P, P + 1] + [0] * (TEST_CONFIG.HASH_LENGTH_FIELD_ELEMENTS - 3)
+    encoded = b"".join(word.to_bytes(4, "little") for word in words)
+    with pytest.raises(SSZValueError) as exception_info:
+        HashDigestVector.decode_bytes(encoded)
+    assert str(exception_info.value) == f"Value {P} exceeds field modulus {P}"
+
+
+def test_hash_digest_vector_decode_rejects_wrong_scope() -> None:
+    """Decoding rejects a payload that is not exactly one digest wide."""
+    expected_total = 4 * TEST_CONFIG.HASH_LENGTH_FIELD_ELEMENTS
+    with pytest.raises(SSZSerializationError) as exception_info:
+        HashDigestVector.decode_bytes(b"\x00" * (expected_total + 1))
+    assert str(exception_info.value) == (
+        f"HashDigestVector: expected {expected_total} bytes, got {expected_total + 1}"
+    )
+
+
 def test_parameter_length_is_parameter_length() -> None:
     """A parameter holds the configured number of personalization elements."""
     assert Parameter.LENGTH == TEST_CONFIG.PARAMETER_LENGTH
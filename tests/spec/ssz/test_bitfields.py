@@ -10,6 +10,7 @@ from pydantic import BaseModel, ValidationError
 from lean_spec.spec.ssz.bitfields import BaseBitlist, BaseBitvector
 from lean_spec.spec.ssz.boolean import Boolean
 from lean_spec.spec.ssz.exceptions import SSZSerializationError, SSZTypeError, SSZValueError
+from lean_spec.spec.ssz.uint import Uint8
 
 # Errors that may be raised either directly or wrapped by Pydantic at construction time.
 ValueOrValidationError = (SSZValueError, ValidationError)
@@ -115,6 +116,13 @@ class TestBitvector:
         with pytest.raises(ValueOrValidationError):
             Bitvector4Model(value=invalid_value)
 
+    def test_equal_bitvectors_hash_equal(self) -> None:
+        """Equal bitvectors hash alike, so sets and dict keys treat them as one."""
+        first = Bitvector4(data=[Boolean(True), Boolean(False), Boolean(True), Boolean(False)])
+        second = Bitvector4(data=[Boolean(1), Boolean(0), Boolean(1), Boolean(0)])
+        assert hash(first) == hash(second)
+        assert len({first, second, Bitvector4(data=[Boolean(False)] * 4)}) == 2
+
     def test_bitvector_is_immutable(self) -> None:
         """Item assignment on a Bitvector raises TypeError — Pydantic models are immutable."""
 
@@ -163,6 +171,30 @@ class TestBitlist:
         instance = Bitlist8(data=bit_generator)  # type: ignore[arg-type]
         assert len(instance) == 3
 
+    def test_equal_bitlists_hash_equal(self) -> None:
+        """Equal bitlists hash alike, so sets and dict keys treat them as one."""
+        first = Bitlist8(data=[Boolean(1), Boolean(0), Boolean(1)])
+        second = Bitlist8(data=[Boolean(True), Boolean(False), Boolean(True)])
+        assert hash(first) == hash(second)
+        assert len({first, second, Bitlist8(data=[Boolean(True), Boolean(False)])}) == 2
+
+    def test_bool_and_int_bits_build_equal_bitlists(self) -> None:
+        """Bools and Booleans take the shared-instance path; other ints match them by value."""
+        fast_path_bits: list[Any] = [True, Boolean(False), Boolean(1), False]
+        constructor_path_bits: list[Any] = [1, Uint8(0), Uint8(1), 0]
+        fast_path_bitlist = Bitlist8(data=fast_path_bits)
+        constructor_path_bitlist = Bitlist8(data=constructor_path_bits)
+        assert fast_path_bitlist == constructor_path_bitlist
+        assert fast_path_bitlist.encode_bytes() == constructor_path_bitlist.encode_bytes()
+        assert all(type(bit) is Boolean for bit in constructor_path_bitlist.data)
+
+    @pytest.mark.parametrize("invalid_bit", [2, -1, Uint8(2)])
+    def test_out_of_range_int_bit_is_rejected(self, invalid_bit: int) -> None:
+        """Ints other than 0 and 1 still go through the Boolean constructor and are rejected."""
+        bits: list[Any] = [True, invalid_bit]
+        with pytest.raises(ValueOrValidationError):
+            Bitlist8(data=bits)
+
     @pytest.mark.parametrize(
         "non_iterable, type_name",
         [